@@ -12,7 +12,10 @@ Endpoints:
 import os
 import json
 import time
+import queue
 import logging
+import threading
+from concurrent.futures import Future
 
 import torch
 from flask import Flask, request, jsonify
@@ -22,8 +25,26 @@ from transformers import AutoTokenizer, AutoModelForSequenceClassification
 MODEL_NAME = "yiyanghkust/finbert-esg-9-categories"
 MAX_BATCH_SIZE = 32
 MAX_SEQ_LENGTH = 512
+# Padded-token budget per forward pass; length-sorted inputs are split into sub-batches under it.
+MAX_BATCH_TOKENS = int(os.environ.get("FINBERT_MAX_BATCH_TOKENS", 4096))
 PORT = int(os.environ.get("PORT", 8080))
 API_KEY = (os.environ.get("FINBERT_API_KEY") or "").strip()
+# Opt-in bf16 autocast on CPU (only worthwhile on CPUs with native bf16, e.g. Sapphire Rapids).
+CPU_BF16 = (os.environ.get("FINBERT_CPU_BF16") or "").strip().lower() in ("1", "true", "yes")
+# Opt-in TorchScript trace + freeze + optimize_for_inference (fuses Linear+Add, Add+LayerNorm, Linear+GELU).
+# Traced graphs are shape-specialised, so inputs are padded to MAX_SEQ_LENGTH when enabled.
+TORCHSCRIPT = (os.environ.get("FINBERT_TORCHSCRIPT") or "").strip().lower() in ("1", "true", "yes")
+# "torch" (default) or "onnx". The ONNX backend needs `optimum[onnxruntime]` (or onnxruntime-gpu) installed;
+# the exported + transformer-fused graph is cached in FINBERT_ONNX_DIR on first start.
+BACKEND = (os.environ.get("FINBERT_BACKEND") or "torch").strip().lower()
+ONNX_DIR = os.environ.get("FINBERT_ONNX_DIR", "onnx")
+# Server-side micro-batching: concurrent /classify requests arriving within this window
+# (up to MAX_BATCH_SIZE texts) share one forward pass. 0 (default) disables; opt in with e.g. 5.
+MICROBATCH_MS = float(os.environ.get("FINBERT_MICROBATCH_MS", 0))
+# Opt-in CUDA graph capture (torch backend, CUDA only): one graph per static (batch, seq) bucket,
+# replayed with a single launch. Inputs larger than every bucket fall back to eager.
+CUDA_GRAPHS = (os.environ.get("FINBERT_CUDA_GRAPHS") or "").strip().lower() in ("1", "true", "yes")
+CUDA_GRAPH_BUCKETS = [(1, 64), (1, 128), (1, 256), (1, 512), (8, 128), (8, 256), (32, 128), (32, 512)]
 
 # --- Logging ──────────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -39,49 +60,301 @@ t0 = time.time()
 
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
-model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-model.to(device)
-model.eval()
+
+
+def _load_onnx_model():
+    """Export + optimise the model to ONNX once (Attention/SkipLayerNorm/BiasGelu fusions), then load it in ORT."""
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer
+    from optimum.onnxruntime.configuration import OptimizationConfig
+
+    provider = "CUDAExecutionProvider" if device.type == "cuda" else "CPUExecutionProvider"
+    optimized_file = "model_optimized.onnx"
+    if not os.path.exists(os.path.join(ONNX_DIR, optimized_file)):
+        log.info("Exporting %s to ONNX in %s", MODEL_NAME, ONNX_DIR)
+        exported = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+        optimizer = ORTOptimizer.from_pretrained(exported)
+        optimizer.optimize(
+            save_dir=ONNX_DIR,
+            optimization_config=OptimizationConfig(
+                optimization_level=99,
+                fp16=device.type == "cuda",
+                optimize_for_gpu=device.type == "cuda",
+            ),
+        )
+    return ORTModelForSequenceClassification.from_pretrained(
+        ONNX_DIR,
+        file_name=optimized_file,
+        provider=provider,
+        use_io_binding=device.type == "cuda",
+    )
+
+
+if BACKEND == "onnx":
+    model = _load_onnx_model()
+    TORCHSCRIPT = False
+else:
+    # SDPA fuses QK^T / mask / softmax / @V into one (Flash / mem-efficient) kernel.
+    model = AutoModelForSequenceClassification.from_pretrained(
+        MODEL_NAME,
+        attn_implementation="sdpa",
+        torchscript=TORCHSCRIPT,
+    )
+    model.to(device)
+    if device.type == "cuda":
+        # FP16 weights halve memory traffic and run matmuls on Tensor Cores.
+        model.half()
+    model.eval()
+
+
+def _cpu_autocast():
+    return torch.autocast(device_type="cpu", dtype=torch.bfloat16, enabled=BACKEND == "torch" and device.type == "cpu" and CPU_BF16)
+
+
+def _trace_model(m):
+    """Trace, freeze and optimise the model for inference. Returns a TorchScript module."""
+    if device.type == "cpu":
+        torch.jit.enable_onednn_fusion(True)
+    shape = (MAX_BATCH_SIZE, MAX_SEQ_LENGTH)
+    example = (
+        torch.ones(shape, dtype=torch.long, device=device),
+        torch.ones(shape, dtype=torch.long, device=device),
+        torch.zeros(shape, dtype=torch.long, device=device),
+    )
+    with torch.no_grad(), _cpu_autocast():
+        traced = torch.jit.trace(m, example, strict=False)
+        traced = torch.jit.freeze(traced)
+        traced = torch.jit.optimize_for_inference(traced)
+        # Warm-up runs let the profiling executor specialise the fused graph.
+        for _ in range(2):
+            traced(*example)
+    return traced
+
+
+traced_model = None
+if TORCHSCRIPT:
+    t1 = time.time()
+    traced_model = _trace_model(model)
+    log.info("TorchScript model traced in %.1fs", time.time() - t1)
+
+
+def _capture_cuda_graphs() -> dict:
+    """Capture one CUDA graph per bucket. Returns {(batch, seq): (graph, static_inputs, static_logits)}.
+
+    The attention mask is fed as a static 3D (batch, query, key) tensor. With a 2D mask the
+    SDPA path checks `torch.all(mask == 1)` on the host to drop the mask, a device sync that
+    cannot be captured (and that would bake the no-mask branch into the graph); a 3D mask goes
+    through get_extended_attention_mask, which is pure tensor ops and honours padding on replay.
+    """
+    graphs = {}
+    pool = torch.cuda.graph_pool_handle()
+    for batch, seq in sorted(CUDA_GRAPH_BUCKETS, key=lambda bs: bs[0] * bs[1]):
+        static = {
+            "input_ids": torch.zeros((batch, seq), dtype=torch.long, device=device),
+            "attention_mask": torch.ones((batch, seq, seq), dtype=model.dtype, device=device),
+            "token_type_ids": torch.zeros((batch, seq), dtype=torch.long, device=device),
+        }
+        # Warm up on a side stream so lazy allocations/autotuning happen outside the capture.
+        side = torch.cuda.Stream()
+        side.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side), torch.inference_mode():
+            for _ in range(3):
+                model(**static)
+        torch.cuda.current_stream().wait_stream(side)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.inference_mode(), torch.cuda.graph(graph, pool=pool):
+            static_logits = model(**static).logits
+        graphs[(batch, seq)] = (graph, static, static_logits)
+    return graphs
+
+
+def _replay_cuda_graph(enc: dict) -> torch.Tensor | None:
+    """Copy enc into the smallest fitting bucket and replay its graph. None if no bucket fits."""
+    rows, cols = enc["input_ids"].shape
+    fitting = [bs for bs in cuda_graphs if bs[0] >= rows and bs[1] >= cols]
+    if not fitting:
+        return None
+    graph, static, static_logits = cuda_graphs[min(fitting, key=lambda bs: bs[0] * bs[1])]
+    with cuda_graph_lock:
+        # Zeroed padding: mask 0 keeps the extra rows/cols out of the real outputs.
+        for buf in static.values():
+            buf.zero_()
+        static["input_ids"][:rows, :cols].copy_(enc["input_ids"])
+        if enc.get("token_type_ids") is not None:
+            static["token_type_ids"][:rows, :cols].copy_(enc["token_type_ids"])
+        # Every query position sees the same key mask: broadcast the 2D mask over the query axis.
+        static["attention_mask"][:rows, :, :cols].copy_(enc["attention_mask"][:, None, :])
+        graph.replay()
+        return static_logits[:rows].clone()
+
+
+@torch.inference_mode()
+def _check_cuda_graphs() -> bool:
+    """Compare graph replay with the eager model on a padded batch; both must give the same logits."""
+    enc = tokenizer(
+        ["Scope 1 emissions fell 12% year on year.",
+         "The board approved a new anti-corruption policy covering all subsidiaries and suppliers."],
+        padding=True, return_tensors="pt",
+    )
+    enc = {k: v.to(device) for k, v in enc.items()}
+    graph_logits = _replay_cuda_graph(enc)
+    eager_logits = model(**enc).logits
+    return graph_logits is not None and torch.allclose(graph_logits.float(), eager_logits.float(), atol=1e-2)
+
+
+cuda_graphs: dict = {}
+cuda_graph_lock = threading.Lock()
+if CUDA_GRAPHS and BACKEND == "torch" and traced_model is None and device.type == "cuda":
+    t1 = time.time()
+    cuda_graphs = _capture_cuda_graphs()
+    if _check_cuda_graphs():
+        log.info("Captured %d CUDA graphs in %.1fs", len(cuda_graphs), time.time() - t1)
+    else:
+        log.error("CUDA graph logits differ from eager on a padded batch; CUDA graphs disabled")
+        cuda_graphs = {}
+
+
+def _forward(enc: dict) -> torch.Tensor:
+    """Run the (traced, CUDA-graph, eager or ONNX Runtime) model and return logits."""
+    with _cpu_autocast():
+        if cuda_graphs:
+            logits = _replay_cuda_graph(enc)
+            if logits is not None:
+                return logits
+        if traced_model is not None:
+            token_type_ids = enc.get("token_type_ids")
+            if token_type_ids is None:
+                token_type_ids = torch.zeros_like(enc["input_ids"])
+            return traced_model(enc["input_ids"], enc["attention_mask"], token_type_ids)[0]
+        return model(**enc).logits
+
 
 # Build label map from model config
 id2label = model.config.id2label
 label_list = [id2label[i] for i in range(len(id2label))]
 
-log.info("Model loaded in %.1fs on %s — %d labels: %s", time.time() - t0, device, len(label_list), label_list)
+log.info(
+    "Model loaded in %.1fs on %s (%s) — %d labels: %s",
+    time.time() - t0, device, BACKEND, len(label_list), label_list,
+)
 
 # --- Flask App ────────────────────────────────────────────────────────────────
 app = Flask(__name__)
 
 
+def _length_buckets(order: list[int], lengths: list[int]) -> list[list[int]]:
+    """Split indices (sorted by ascending length) into groups whose padded size fits MAX_BATCH_TOKENS."""
+    groups: list[list[int]] = []
+    current: list[int] = []
+    for i in order:
+        # Ascending order: the newest item sets the padded length of the group.
+        if current and (len(current) + 1) * lengths[i] > MAX_BATCH_TOKENS:
+            groups.append(current)
+            current = []
+        current.append(i)
+    if current:
+        groups.append(current)
+    return groups
+
+
 @torch.inference_mode()
 def predict(texts: list[str]) -> list[list[dict]]:
     """Run inference on a list of texts. Returns [[{label, score}, ...], ...]."""
     # Truncate long texts to ~1200 chars (BERT 512 tokens ≈ 1500 chars)
     truncated = [t[:1200] if len(t) > 1200 else t for t in texts]
 
-    enc = tokenizer(
-        truncated,
-        padding=True,
-        truncation=True,
-        max_length=MAX_SEQ_LENGTH,
-        return_tensors="pt",
-    )
-    enc = {k: v.to(device) for k, v in enc.items()}
-
-    logits = model(**enc).logits
-    probs = torch.nn.functional.softmax(logits, dim=-1).cpu().numpy()
-
-    results = []
-    for row in probs:
-        scores = [
-            {"label": label_list[i], "score": round(float(row[i]), 6)}
-            for i in range(len(label_list))
-        ]
-        # Sort by score descending
-        scores.sort(key=lambda x: x["score"], reverse=True)
-        results.append(scores)
-
-    return results
+    # Tokenize once unpadded, then pad per length-sorted sub-batch so short texts
+    # are not padded out to the longest text in the request.
+    enc = tokenizer(truncated, truncation=True, max_length=MAX_SEQ_LENGTH)
+    lengths = [len(ids) for ids in enc["input_ids"]]
+    order = sorted(range(len(truncated)), key=lengths.__getitem__)
+
+    probs = torch.empty((len(truncated), len(label_list)), dtype=torch.float32)
+    for group in _length_buckets(order, lengths):
+        batch = tokenizer.pad(
+            {k: [v[i] for i in group] for k, v in enc.items()},
+            padding="max_length" if traced_model is not None else True,
+            max_length=MAX_SEQ_LENGTH,
+            return_tensors="pt",
+        )
+        if device.type == "cuda":
+            # Pinned host memory makes the H2D copies async; the .cpu() below synchronises.
+            batch = {k: v.pin_memory().to(device, non_blocking=True) for k, v in batch.items()}
+        else:
+            batch = {k: v.to(device) for k, v in batch.items()}
+        logits = _forward(batch)
+        # Normalise in FP32 so half-precision logits don't lose resolution in the softmax.
+        probs[group] = torch.nn.functional.softmax(logits.float(), dim=-1).cpu()
+
+    return _rank_scores(probs)
+
+
+def _rank_scores(probs: torch.Tensor) -> list[list[dict]]:
+    """Per row, ``{label, score}`` dicts sorted by score descending, scores rounded to 6 places."""
+    # Sort in one vectorised op; round the Python floats, since rounding in float32
+    # serialises as e.g. 0.9876539707183838 instead of 0.987654.
+    top_scores, top_ids = torch.topk(probs, k=probs.size(-1), dim=-1, sorted=True)
+    return [
+        [{"label": label_list[i], "score": round(score, 6)} for i, score in zip(ids, scores)]
+        for ids, scores in zip(top_ids.tolist(), top_scores.tolist())
+    ]
+
+
+class MicroBatcher:
+    """Coalesce concurrent predict() calls into a single forward pass on a background thread."""
+
+    def __init__(self, max_batch_size: int, max_latency_ms: float):
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self._queue: "queue.Queue[tuple[list[str], Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="finbert-microbatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: list[str]) -> list[list[dict]]:
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future.result()
+
+    def _run(self) -> None:
+        carry = None
+        while True:
+            first = carry or self._queue.get()
+            carry = None
+            items = [first]
+            total = len(first[0])
+            deadline = time.monotonic() + self.max_latency
+            while total < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if total + len(item[0]) > self.max_batch_size:
+                    # Doesn't fit; it opens the next batch.
+                    carry = item
+                    break
+                items.append(item)
+                total += len(item[0])
+
+            texts = [t for item_texts, _ in items for t in item_texts]
+            try:
+                predictions = predict(texts)
+            except Exception as exc:
+                for _, future in items:
+                    future.set_exception(exc)
+                continue
+
+            offset = 0
+            for item_texts, future in items:
+                future.set_result(predictions[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+            if len(items) > 1:
+                log.info("Micro-batched %d requests (%d texts)", len(items), total)
+
+
+batcher = MicroBatcher(MAX_BATCH_SIZE, MICROBATCH_MS) if MICROBATCH_MS > 0 else None
 
 
 @app.route("/health", methods=["GET"])
@@ -91,6 +364,7 @@ def health():
         "ok": True,
         "model": MODEL_NAME,
         "device": str(device),
+        "backend": BACKEND,
         "labels": label_list,
     })
 
@@ -139,7 +413,7 @@ def classify():
         return jsonify({"error": "All inputs were empty"}), 400
 
     t0 = time.time()
-    predictions = predict(valid_inputs)
+    predictions = batcher.submit(valid_inputs) if batcher else predict(valid_inputs)
     duration_ms = round((time.time() - t0) * 1000, 1)
 
     # Reconstruct full results array (empty results for empty inputs)
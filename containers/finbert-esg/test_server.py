@@ -0,0 +1,21 @@
+"""Checks for the inference server's response format (loads the model; run with ``pytest containers/finbert-esg``)."""
+
+import json
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("flask")
+server = pytest.importorskip("server")
+
+
+def test_scores_serialize_with_six_decimals():
+    n = len(server.label_list)
+    row = [0.987654321] + [(1 - 0.987654321) / (n - 1)] * (n - 1)
+    ranked = server._rank_scores(torch.tensor([row], dtype=torch.float32))
+    top = ranked[0][0]
+    assert top["label"] == server.label_list[0]
+    assert json.dumps(top["score"]) == "0.987654"
+    assert all(len(json.dumps(s["score"]).split(".")[-1]) <= 6 for s in ranked[0])
+    assert [s["score"] for s in ranked[0]] == sorted((s["score"] for s in ranked[0]), reverse=True)
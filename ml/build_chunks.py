@@ -1,40 +1,81 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from transformers import AutoTokenizer
 
-from jsonl import read_jsonl
+from jsonl import WRITE_BUFFER_SIZE, dumps_line, read_jsonl
+
+
+# Any blank line (possibly holding whitespace) between two newlines is a paragraph break.
+_PARA_BREAK_RE = re.compile(r"\n\s*\n")
 
 
 def _split_paragraphs(text: str) -> List[str]:
     if not text:
         return []
-    parts = re.split(r"\n\s*\n+", text)
-    return [p.strip() for p in parts if p.strip()]
+    # Canonicalise breaks to "\n\n" once, then split/strip at C level in one pass.
+    text = _PARA_BREAK_RE.sub("\n\n", text)
+    return [p for p in (s.strip() for s in text.split("\n\n")) if p]
 
 
-def _chunk_token_ids(
-    token_ids: List[int],
+def _window_spans(
+    n_tokens: int,
     max_tokens: int,
     overlap: int,
-) -> Iterator[List[int]]:
+) -> Iterator[Tuple[int, int]]:
+    """Yield [start, end) token index spans of overlapping windows over n_tokens tokens."""
     if max_tokens <= 0:
-        yield token_ids
+        yield 0, n_tokens
         return
     stride = max(1, max_tokens - max(0, overlap))
     i = 0
-    while i < len(token_ids):
-        yield token_ids[i : i + max_tokens]
-        if i + max_tokens >= len(token_ids):
+    while i < n_tokens:
+        yield i, min(i + max_tokens, n_tokens)
+        if i + max_tokens >= n_tokens:
             break
         i += stride
 
 
+def _chunk_paragraphs(
+    paras: List[str],
+    tokenizer,
+    max_tokens: int,
+    overlap: int,
+    min_tokens: int,
+    min_chars: int,
+) -> List[Tuple[Tuple[str, int], ...]]:
+    """Tokenize and window a list of paragraphs in one batched call. Returns (text, token_count) chunks per paragraph.
+
+    Chunk text is sliced from the paragraph via the fast tokenizer's character offsets,
+    so there is no decode pass and chunks keep the original text verbatim.
+    """
+    offsets_per_para = tokenizer(
+        paras,
+        add_special_tokens=False,
+        return_attention_mask=False,
+        return_token_type_ids=False,
+        return_offsets_mapping=True,
+    )["offset_mapping"]
+
+    out: List[Tuple[Tuple[str, int], ...]] = []
+    for para, offsets in zip(paras, offsets_per_para):
+        chunks: List[Tuple[str, int]] = []
+        if len(offsets) >= min_tokens:
+            for start, end in _window_spans(len(offsets), max_tokens=max_tokens, overlap=overlap):
+                if end <= start or end - start < min_tokens:
+                    continue
+                chunk_text = para[offsets[start][0] : offsets[end - 1][1]].strip()
+                if len(chunk_text) >= min_chars:
+                    chunks.append((chunk_text, end - start))
+        out.append(tuple(chunks))
+    return out
+
+
 def build_chunks(
     pages: Iterable[Dict[str, Any]],
     tokenizer,
@@ -42,7 +83,12 @@ def build_chunks(
     overlap: int,
     min_tokens: int,
     min_chars: int,
+    cache_size: int = 50_000,
 ) -> Iterator[Dict[str, Any]]:
+    # Reports repeat boilerplate (headers, footers, safe-harbour text) across pages and
+    # reports; keep a bounded LRU of per-paragraph chunk results keyed on the paragraph text.
+    cache: "OrderedDict[str, Tuple[Tuple[str, int], ...]]" = OrderedDict()
+
     for row in pages:
         text = str(row.get("text") or "").strip()
         if not text:
@@ -51,19 +97,27 @@ def build_chunks(
         report_key = row.get("k")
         page_num = row.get("page")
 
+        paras = [p for p in _split_paragraphs(text) if len(p) >= min_chars]
+        resolved: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        for para in paras:
+            hit = cache.get(para)
+            if hit is not None:
+                cache.move_to_end(para)
+                resolved[para] = hit
+        missing = [p for p in dict.fromkeys(paras) if p not in resolved]
+        if missing:
+            for para, chunks in zip(
+                missing,
+                _chunk_paragraphs(missing, tokenizer, max_tokens, overlap, min_tokens, min_chars),
+            ):
+                resolved[para] = chunks
+                cache[para] = chunks
+            while len(cache) > cache_size:
+                cache.popitem(last=False)
+
         chunk_in_page = 0
-        for para in _split_paragraphs(text):
-            if len(para) < min_chars:
-                continue
-            ids = tokenizer.encode(para, add_special_tokens=False)
-            if len(ids) < min_tokens:
-                continue
-            for window in _chunk_token_ids(ids, max_tokens=max_tokens, overlap=overlap):
-                if len(window) < min_tokens:
-                    continue
-                chunk_text = tokenizer.decode(window, skip_special_tokens=True, clean_up_tokenization_spaces=True).strip()
-                if len(chunk_text) < min_chars:
-                    continue
+        for para in paras:
+            for chunk_text, token_count in resolved[para]:
                 chunk_in_page += 1
                 out = {
                     "k": report_key,
@@ -76,7 +130,7 @@ def build_chunks(
                     "page": page_num,
                     "chunk_in_page": chunk_in_page,
                     "text": chunk_text,
-                    "token_count": len(window),
+                    "token_count": token_count,
                 }
                 yield out
 
@@ -103,7 +157,7 @@ def main() -> int:
     pages = read_jsonl(in_path)
     written = 0
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
+    with out_path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
         for chunk in build_chunks(
             pages,
             tokenizer=tokenizer,
@@ -112,7 +166,7 @@ def main() -> int:
             min_tokens=args.min_tokens,
             min_chars=args.min_chars,
         ):
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+            f.write(dumps_line(chunk))
             written += 1
             if written and written % 500 == 0:
                 print(f"[chunks] wrote_chunks={written}...")
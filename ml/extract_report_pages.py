@@ -1,26 +1,36 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import fitz  # PyMuPDF
+import orjson
+
+from jsonl import WRITE_BUFFER_SIZE, dumps_line
+
+
+_CRLF_RE = re.compile(r"\r\n?")
+_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
 
 
 def _normalize_text(text: str) -> str:
     text = text.replace("\u00a0", " ")
-    text = re.sub(r"\r\n?", "\n", text)
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _CRLF_RE.sub("\n", text)
+    text = _TRAILING_WS_RE.sub("\n", text)
+    text = _MULTI_NL_RE.sub("\n\n", text)
     return text.strip()
 
 
 def _load_reports_index(index_path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
     if not index_path:
         return {}
-    rows = json.loads(index_path.read_text(encoding="utf-8"))
+    rows = orjson.loads(index_path.read_bytes())
     out: Dict[str, Dict[str, Any]] = {}
     for row in rows:
         k = row.get("k")
@@ -30,34 +40,101 @@ def _load_reports_index(index_path: Optional[Path]) -> Dict[str, Dict[str, Any]]
 
 
 def _iter_local_pdfs_from_index(index: Dict[str, Dict[str, Any]], r2_root: Path) -> Iterator[Dict[str, Any]]:
+    root = os.path.abspath(r2_root)
     for k, row in index.items():
-        local_path = (r2_root / k).resolve()
-        if local_path.exists() and local_path.is_file():
+        # abspath is pure string work; isfile is the only stat per entry.
+        local_path = os.path.join(root, k)
+        if os.path.isfile(local_path):
             yield {
                 "k": k,
-                "local_path": str(local_path),
+                "local_path": local_path,
                 "index_row": row,
             }
 
 
+def _scan_pdfs(root: str) -> List[str]:
+    """Sorted paths of all *.pdf files under root (iterative os.scandir walk, no extra stat calls)."""
+    found: List[str] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".pdf") and entry.is_file(follow_symlinks=False):
+                    found.append(entry.path)
+    return sorted(found)
+
+
+# Plain-text extraction flags: expand ligatures (no TEXT_PRESERVE_LIGATURES) and join
+# words hyphenated across line breaks, which is what the downstream tokenizers want.
+_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
+
+
 def _extract_pages(pdf_path: Path) -> Iterator[Dict[str, Any]]:
     doc = fitz.open(pdf_path)
     try:
         for page_i in range(doc.page_count):
             page = doc.load_page(page_i)
-            text = page.get_text("text") or ""
+            textpage = page.get_textpage(flags=_TEXT_FLAGS)
+            text = textpage.extractText() or ""
             text = _normalize_text(text)
             yield {"page": page_i + 1, "text": text}
     finally:
         doc.close()
 
 
+def _init_worker() -> None:
+    # MuPDF warnings are noisy on real-world PDFs and cost time to format/print.
+    fitz.TOOLS.mupdf_display_errors(False)
+    fitz.TOOLS.mupdf_display_warnings(False)
+
+
+def _extract_one_pdf(pdf: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract all page rows for one PDF (runs in a worker process)."""
+    k = pdf["k"]
+    pdf_path = Path(pdf["local_path"])
+    index_row = pdf.get("index_row") or {}
+
+    # Parse `reports/<year>/<slug>/<filename>.pdf` if present.
+    year = None
+    slug = None
+    parts = Path(k).parts
+    if len(parts) >= 4 and parts[0] == "reports":
+        try:
+            year = int(parts[1])
+        except Exception:
+            year = None
+        slug = parts[2]
+
+    rows: List[Dict[str, Any]] = []
+    for page_row in _extract_pages(pdf_path):
+        rows.append(
+            {
+                "k": k,
+                "local_path": str(pdf_path),
+                "year": year or index_row.get("y"),
+                "slug": slug,
+                "report_id": index_row.get("id"),
+                "company": index_row.get("c"),
+                "country": index_row.get("ct"),
+                "sector": index_row.get("s"),
+                "industry_group": index_row.get("i"),
+                "page": page_row["page"],
+                "text": page_row["text"],
+                "text_chars": len(page_row["text"]),
+            }
+        )
+    return rows
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Extract per-page text from local R2 PDFs into JSONL.")
     ap.add_argument("--index", type=str, default="src/data/reportsIndex.json", help="Path to reportsIndex.json")
     ap.add_argument("--r2-root", type=str, default="reports_artifacts/r2", help="Local path to R2 mirror root")
     ap.add_argument("--out", type=str, default="ml/data/pages.jsonl", help="Output JSONL path")
     ap.add_argument("--limit", type=int, default=0, help="Max number of PDFs to process (0 = no limit)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (1 = in-process)")
     args = ap.parse_args()
 
     index_path = Path(args.index) if args.index else None
@@ -69,55 +146,32 @@ def main() -> int:
 
     if not pdf_rows:
         # Fallback: scan local PDFs under r2-root/reports/**.pdf
-        scan_root = r2_root / "reports"
-        pdf_paths = sorted(scan_root.rglob("*.pdf")) if scan_root.exists() else []
+        root = os.path.abspath(r2_root)
+        scan_root = os.path.join(root, "reports")
+        pdf_paths = _scan_pdfs(scan_root) if os.path.isdir(scan_root) else []
         for p in pdf_paths:
-            rel = p.relative_to(r2_root).as_posix()
-            pdf_rows.append({"k": rel, "local_path": str(p.resolve()), "index_row": None})
+            rel = os.path.relpath(p, root).replace(os.sep, "/")
+            pdf_rows.append({"k": rel, "local_path": p, "index_row": None})
 
     if args.limit and args.limit > 0:
         pdf_rows = pdf_rows[: args.limit]
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
     written = 0
-    with out_path.open("w", encoding="utf-8") as out_f:
-        for i, pdf in enumerate(pdf_rows, start=1):
-            k = pdf["k"]
-            pdf_path = Path(pdf["local_path"])
-            index_row = pdf.get("index_row") or {}
-
-        # Parse `reports/<year>/<slug>/<filename>.pdf` if present.
-        year = None
-        slug = None
-        parts = Path(k).parts
-        if len(parts) >= 4 and parts[0] == "reports":
-            try:
-                year = int(parts[1])
-            except Exception:
-                year = None
-            slug = parts[2]
-
-            for page_row in _extract_pages(pdf_path):
-                out_f.write(
-                    json.dumps(
-                        {
-                            "k": k,
-                            "local_path": str(pdf_path),
-                            "year": year or index_row.get("y"),
-                            "slug": slug,
-                            "report_id": index_row.get("id"),
-                            "company": index_row.get("c"),
-                            "country": index_row.get("ct"),
-                            "sector": index_row.get("s"),
-                            "industry_group": index_row.get("i"),
-                            "page": page_row["page"],
-                            "text": page_row["text"],
-                            "text_chars": len(page_row["text"]),
-                        },
-                        ensure_ascii=False,
-                    )
-                    + "\n"
-                )
+    workers = max(1, min(args.workers, len(pdf_rows) or 1))
+    with ExitStack() as stack:
+        if workers > 1:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=workers, initializer=_init_worker))
+            results = ex.map(_extract_one_pdf, pdf_rows, chunksize=4)
+        else:
+            _init_worker()
+            results = map(_extract_one_pdf, pdf_rows)
+
+        # Single writer in the parent keeps the JSONL in pdf_rows order.
+        out_f = stack.enter_context(out_path.open("wb", buffering=WRITE_BUFFER_SIZE))
+        for i, rows in enumerate(results, start=1):
+            for row in rows:
+                out_f.write(dumps_line(row))
                 written += 1
 
             if i % 10 == 0:
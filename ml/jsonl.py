@@ -1,24 +1,32 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator
 
+import orjson
+
+# 1 MiB write buffer: JSONL outputs are large and the default 8 KiB buffer means many small syscalls.
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def read_jsonl(path: str | Path) -> Iterator[Dict[str, Any]]:
     p = Path(path)
-    with p.open("r", encoding="utf-8") as f:
+    with p.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            yield json.loads(line)
+            yield orjson.loads(line)
+
+
+def dumps_line(row: Dict[str, Any]) -> bytes:
+    """Serialise one row as a UTF-8 JSONL line (for files opened in binary mode)."""
+    return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
 
 
 def write_jsonl(path: str | Path, rows: Iterable[Dict[str, Any]]) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
+    with p.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.write(dumps_line(row))
 
@@ -15,15 +15,105 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterator, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import langextract as lx
 from langextract.core import base_model
 from langextract.core import types as lx_types
 
 
+class _RateLimiter:
+    """Thread-safe token bucket: at most ``per_minute`` acquisitions per rolling minute."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.interval = 60.0 / per_minute
+        self.capacity = max(1.0, per_minute / 60.0)  # allow ~1s of burst
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) * self.interval
+            time.sleep(wait)
+
+
+# langextract builds a new provider per extract() call; share one bucket per rate
+# so the limit holds across concurrent reports.
+_LIMITERS: dict[float, _RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _shared_limiter(per_minute: float) -> _RateLimiter | None:
+    if not per_minute or per_minute <= 0:
+        return None
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(per_minute)
+        if limiter is None:
+            limiter = _LIMITERS[per_minute] = _RateLimiter(per_minute)
+        return limiter
+
+
+# Connections and the request pool are also process-wide: each extract() call gets a
+# fresh provider, but all of them should reuse the same warm keep-alive connections and
+# feed one continuously-busy pool of in-flight requests.
+_SESSIONS: dict[str, requests.Session] = {}
+_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared_session(api_token: str) -> requests.Session:
+    with _SHARED_LOCK:
+        session = _SESSIONS.get(api_token)
+        if session is None:
+            # Keep-alive pool skips a TCP+TLS handshake per request; retry
+            # transient rate-limit / 5xx responses.
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "Authorization": f"Bearer {api_token}",
+                    "Content-Type": "application/json",
+                }
+            )
+            _SESSIONS[api_token] = session
+        return session
+
+
+def _shared_executor(max_concurrent: int) -> ThreadPoolExecutor:
+    with _SHARED_LOCK:
+        executor = _EXECUTORS.get(max_concurrent)
+        if executor is None:
+            executor = _EXECUTORS[max_concurrent] = ThreadPoolExecutor(
+                max_workers=max_concurrent,
+                thread_name_prefix="cf-workers-ai",
+            )
+        return executor
+
+
 # Register with langextract's provider registry.
 # Pattern matches Cloudflare model IDs like "@cf/meta/llama-..." as well as
 # the shorthand "cloudflare" or "cf-..." names.
@@ -45,6 +135,12 @@ class CloudflareWorkersAIProvider(base_model.BaseLanguageModel):
         api_token: Cloudflare API token.
         temperature: Sampling temperature.
         max_tokens: Maximum tokens to generate.
+        max_workers: Concurrent requests per ``infer`` batch.
+        requests_per_minute: Process-wide request budget (0 = unlimited).
+        max_concurrent_requests: Size of a process-wide request pool shared by
+            every provider instance, so prompts from concurrent extract() calls
+            (e.g. different reports) keep a fixed number of requests in flight.
+            0 = per-call pool of ``max_workers``.
     """
 
     # Tell langextract this provider needs fenced output (no native schema).
@@ -58,6 +154,9 @@ class CloudflareWorkersAIProvider(base_model.BaseLanguageModel):
         api_key: str | None = None,  # langextract passes this kwarg
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        max_workers: int = 8,
+        requests_per_minute: float = 0,
+        max_concurrent_requests: int = 0,
         **kwargs: Any,
     ) -> None:
         super().__init__()
@@ -71,6 +170,9 @@ class CloudflareWorkersAIProvider(base_model.BaseLanguageModel):
         )
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.max_workers = max(1, int(max_workers))
+        self._limiter = _shared_limiter(float(requests_per_minute or 0))
+        self.max_concurrent_requests = max(0, int(max_concurrent_requests or 0))
         self._extra_kwargs = kwargs
 
         if not self.account_id:
@@ -88,6 +190,7 @@ class CloudflareWorkersAIProvider(base_model.BaseLanguageModel):
             f"https://api.cloudflare.com/client/v4/accounts/"
             f"{self.account_id}/ai/v1/chat/completions"
         )
+        self._session = _shared_session(self.api_token)
 
     # ------------------------------------------------------------------
     # langextract interface
@@ -110,46 +213,70 @@ class CloudflareWorkersAIProvider(base_model.BaseLanguageModel):
         temperature = kwargs.get("temperature", self.temperature)
         max_tokens = kwargs.get("max_tokens", self.max_tokens)
 
-        for prompt in batch_prompts:
-            payload = {
-                "model": self.model_id,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
-
-            try:
-                resp = requests.post(
-                    self._base_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=120,
+        if self.max_concurrent_requests:
+            # Hand every prompt to the shared pool up front; it interleaves them
+            # with prompts from other in-flight extract() calls.
+            executor = _shared_executor(self.max_concurrent_requests)
+            futures = [
+                executor.submit(self._infer_one, prompt, temperature, max_tokens)
+                for prompt in batch_prompts
+            ]
+            for future in futures:
+                yield future.result()
+            return
+
+        if self.max_workers <= 1 or len(batch_prompts) <= 1:
+            for prompt in batch_prompts:
+                yield self._infer_one(prompt, temperature, max_tokens)
+            return
+
+        # Run prompts concurrently but yield in submission order.
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batch_prompts))) as ex:
+            yield from ex.map(
+                lambda prompt: self._infer_one(prompt, temperature, max_tokens),
+                batch_prompts,
+            )
+
+    def _infer_one(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Sequence[lx.inference.ScoredOutput]:
+        payload = {
+            "model": self.model_id,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        if self._limiter is not None:
+            self._limiter.acquire()
+
+        try:
+            resp = self._session.post(self._base_url, json=payload, timeout=120)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # OpenAI-compatible response shape
+            choices = data.get("choices") or []
+            if choices:
+                text = (
+                    choices[0].get("message", {}).get("content", "")
+                    or ""
                 )
-                resp.raise_for_status()
-                data = resp.json()
-
-                # OpenAI-compatible response shape
-                choices = data.get("choices") or []
-                if choices:
-                    text = (
-                        choices[0].get("message", {}).get("content", "")
-                        or ""
-                    )
-                else:
-                    text = ""
-
-                yield [lx_types.ScoredOutput(score=1.0, output=text.strip())]
-
-            except requests.RequestException as exc:
-                raise lx.exceptions.InferenceRuntimeError(
-                    f"Cloudflare Workers AI request failed: {exc}",
-                    original=exc,
-                ) from exc
-            except (KeyError, json.JSONDecodeError) as exc:
-                raise lx.exceptions.InferenceRuntimeError(
-                    f"Unexpected response format from Workers AI: {exc}",
-                    original=exc,
-                ) from exc
+            else:
+                text = ""
+
+            return [lx_types.ScoredOutput(score=1.0, output=text.strip())]
+
+        except requests.RequestException as exc:
+            raise lx.exceptions.InferenceRuntimeError(
+                f"Cloudflare Workers AI request failed: {exc}",
+                original=exc,
+            ) from exc
+        except (KeyError, json.JSONDecodeError) as exc:
+            raise lx.exceptions.InferenceRuntimeError(
+                f"Unexpected response format from Workers AI: {exc}",
+                original=exc,
+            ) from exc
@@ -25,10 +25,15 @@ Environment variables
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import re
+import sqlite3
 import textwrap
+from collections import Counter, deque
+from itertools import groupby
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
 
 import dotenv
 
@@ -43,6 +48,9 @@ if str(_ml_dir) not in sys.path:
 from langextract_cloudflare import CloudflareWorkersAIProvider  # noqa: F401
 
 import langextract as lx
+import orjson
+
+from jsonl import WRITE_BUFFER_SIZE, dumps_line
 
 # ── Prompt & few-shot examples ───────────────────────────────────────────
 
@@ -78,20 +86,21 @@ PROMPT_DESCRIPTION = textwrap.dedent("""\
     5. Prefer specific numeric data over vague qualitative statements.
 """)
 
-# High-quality few-shot examples built from real sustainability report text.
+# One compact few-shot example covering the extraction classes. It is sent
+# with every chunk request, so every sentence in it is extracted and nothing
+# is repeated.
 EXAMPLES: List[lx.data.ExampleData] = [
     lx.data.ExampleData(
         text=textwrap.dedent("""\
-            Scope 1 and 2 emissions: We will reduce our corporate emissions
-            in line with a net-zero climate scenario by achieving a 100%
-            reduction in absolute scope 1 and 2 GHG emissions by FY28 from
-            a FY20 base year. Over FY24, we maintained scope 1 emissions at
-            zero. Total carbon footprint: Scope 1 14,011 tCO2e, Scope 2
-            market-based 4,732 tCO2e, Scope 3 1,673,903 tCO2e. Carbon
-            intensity 3.43 tCO2e/revenue US$'m. Energy use: Renewable
-            14,560 MWh, Non-renewable 62,129 MWh. Employee diversity: 42%
-            women in management roles. Our Board approved an updated Data
-            Privacy Policy in FY24.
+            We will achieve a 100% reduction in absolute scope 1 and 2 GHG
+            emissions by FY28 from a FY20 base year. Scope 1 14,011 tCO2e,
+            Scope 3 1,673,903 tCO2e. Energy use: Renewable 14,560 MWh,
+            Non-renewable 62,129 MWh. Water withdrawal totalled 1.2 million
+            m³. Hazardous waste generated was 340 tonnes. 42% women in
+            management roles. Our Board approved an updated Data Privacy
+            Policy in FY24. We invested €12 million in community development
+            programmes. This report was prepared in accordance with the GRI
+            Standards 2021.
         """),
         extractions=[
             lx.data.Extraction(
@@ -102,139 +111,52 @@ EXAMPLES: List[lx.data.ExampleData] = [
                     "reduction_pct": "100%",
                     "target_year": "FY28",
                     "base_year": "FY20",
-                    "framework": "SBTi / Paris-aligned",
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="ghg_emissions",
-                extraction_text="scope 1 emissions at zero",
-                attributes={
-                    "scope": "scope 1",
-                    "value": "0",
-                    "unit": "tCO2e",
-                    "period": "FY24",
                 },
             ),
             lx.data.Extraction(
                 extraction_class="ghg_emissions",
                 extraction_text="Scope 1 14,011 tCO2e",
-                attributes={
-                    "scope": "scope 1",
-                    "value": "14011",
-                    "unit": "tCO2e",
-                    "period": "FY24",
-                },
+                attributes={"scope": "scope 1", "value": "14011", "unit": "tCO2e"},
             ),
             lx.data.Extraction(
                 extraction_class="ghg_emissions",
-                extraction_text="Scope 2 market-based 4,732 tCO2e",
-                attributes={
-                    "scope": "scope 2 market-based",
-                    "value": "4732",
-                    "unit": "tCO2e",
-                    "period": "FY24",
-                },
+                extraction_text="Scope 3 1,673,903 tCO2e",
+                attributes={"scope": "scope 3", "value": "1673903", "unit": "tCO2e"},
             ),
             lx.data.Extraction(
-                extraction_class="ghg_emissions",
-                extraction_text="Scope 3 1,673,903 tCO2e",
-                attributes={
-                    "scope": "scope 3",
-                    "value": "1673903",
-                    "unit": "tCO2e",
-                    "period": "FY24",
-                },
+                extraction_class="energy",
+                extraction_text="Renewable 14,560 MWh, Non-renewable 62,129 MWh",
+                attributes={"renewable_mwh": "14560", "non_renewable_mwh": "62129"},
             ),
             lx.data.Extraction(
-                extraction_class="ghg_emissions",
-                extraction_text="Carbon intensity 3.43 tCO2e/revenue US$'m",
-                attributes={
-                    "metric": "carbon intensity",
-                    "value": "3.43",
-                    "unit": "tCO2e/US$m revenue",
-                },
+                extraction_class="water",
+                extraction_text="Water withdrawal totalled 1.2 million m³",
+                attributes={"metric": "water withdrawal", "value": "1200000", "unit": "m³"},
             ),
             lx.data.Extraction(
-                extraction_class="energy",
-                extraction_text="Renewable 14,560 MWh, Non-renewable 62,129 MWh",
-                attributes={
-                    "renewable_mwh": "14560",
-                    "non_renewable_mwh": "62129",
-                    "total_mwh": "76689",
-                },
+                extraction_class="waste",
+                extraction_text="Hazardous waste generated was 340 tonnes",
+                attributes={"metric": "hazardous waste", "value": "340", "unit": "tonnes"},
             ),
             lx.data.Extraction(
                 extraction_class="social_metric",
                 extraction_text="42% women in management roles",
-                attributes={
-                    "metric": "gender diversity",
-                    "value": "42%",
-                    "scope": "management",
-                },
+                attributes={"metric": "gender diversity", "value": "42%", "scope": "management"},
             ),
             lx.data.Extraction(
                 extraction_class="governance_policy",
                 extraction_text="Board approved an updated Data Privacy Policy in FY24",
-                attributes={
-                    "policy": "Data Privacy Policy",
-                    "status": "approved / updated",
-                    "year": "FY24",
-                },
+                attributes={"policy": "Data Privacy Policy", "status": "updated", "year": "FY24"},
             ),
-        ],
-    ),
-    lx.data.ExampleData(
-        text=textwrap.dedent("""\
-            Our sustainability report was prepared in accordance with the
-            GRI Standards 2021 and we applied the TCFD recommendations.
-            Water withdrawal totalled 1.2 million m³, a 5% reduction from
-            the prior year. Hazardous waste generated was 340 tonnes.
-            We invested €12 million in community development programmes.
-        """),
-        extractions=[
             lx.data.Extraction(
-                extraction_class="regulatory",
-                extraction_text="prepared in accordance with the GRI Standards 2021",
-                attributes={
-                    "framework": "GRI Standards 2021",
-                    "type": "reporting standard",
-                },
+                extraction_class="financial_esg",
+                extraction_text="invested €12 million in community development programmes",
+                attributes={"metric": "community investment", "value": "12000000", "currency": "EUR"},
             ),
             lx.data.Extraction(
                 extraction_class="regulatory",
-                extraction_text="applied the TCFD recommendations",
-                attributes={
-                    "framework": "TCFD",
-                    "type": "disclosure framework",
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="water",
-                extraction_text="Water withdrawal totalled 1.2 million m³",
-                attributes={
-                    "metric": "water withdrawal",
-                    "value": "1200000",
-                    "unit": "m³",
-                    "change": "-5% YoY",
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="waste",
-                extraction_text="Hazardous waste generated was 340 tonnes",
-                attributes={
-                    "metric": "hazardous waste",
-                    "value": "340",
-                    "unit": "tonnes",
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="financial_esg",
-                extraction_text="invested €12 million in community development programmes",
-                attributes={
-                    "metric": "community investment",
-                    "value": "12000000",
-                    "currency": "EUR",
-                },
+                extraction_text="prepared in accordance with the GRI Standards 2021",
+                attributes={"framework": "GRI Standards 2021", "type": "reporting standard"},
             ),
         ],
     ),
@@ -259,70 +181,338 @@ ISSUE_TO_PILLAR: Dict[str, str] = {
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
+def _is_cloudflare_model(model_id: str) -> bool:
+    return model_id.startswith(("@cf/", "cloudflare", "cf-"))
+
+
 def _read_jsonl(path: Path):
     """Yield dicts from a JSONL file."""
-    with path.open("r", encoding="utf-8") as fh:
+    with path.open("rb") as fh:
         for line in fh:
-            line = line.strip()
-            if line:
-                yield json.loads(line)
+            if not line.isspace():
+                yield orjson.loads(line)
+
+
+# Pages with fewer ESG keyword hits than --min-keyword-hits (tables of contents,
+# legal disclaimers, photo spreads) are not sent to the LLM.
+ESG_KEYWORDS = [
+    r"scope\s*[123]", r"tco2e?", r"co2", r"ghg", r"greenhouse", r"emissions?", r"carbon",
+    r"net[\s-]zero", r"decarboni[sz]", r"climate", r"sbti", r"science[\s-]based", r"tcfd",
+    r"gri", r"sasb", r"csrd", r"esrs", r"issb", r"taxonomy", r"sfdr", r"cdp",
+    r"renewable", r"energy", r"mwh", r"gwh", r"kwh", r"fossil", r"coal", r"methane",
+    r"water", r"waste", r"recycl", r"circular", r"pollution", r"biodiversity", r"deforestation",
+    r"land use", r"packaging", r"hazardous",
+    r"sustainab", r"esg", r"environment", r"transition plan", r"physical risk", r"transition risk",
+    r"employees?", r"workforce", r"diversity", r"inclusion", r"gender", r"pay gap",
+    r"health and safety", r"safety", r"ltifr", r"trir", r"fatalit", r"injur", r"training",
+    r"human rights", r"labou?r", r"supply chain", r"suppliers?", r"community", r"wellbeing",
+    r"board", r"governance", r"independent director", r"remuneration", r"audit committee",
+    r"ethics", r"anti[\s-]corruption", r"bribery", r"whistleblow", r"compliance",
+    r"materiality", r"stakeholder", r"target", r"baseline", r"reduction", r"policy",
+]
+
+try:
+    import hyperscan
+except ImportError:  # optional; compiled `re` fallback below
+    hyperscan = None
+
+try:
+    from xxhash import xxh3_64_intdigest as _dedup_key
+except ImportError:  # optional; stdlib blake2b fallback, wide enough that collisions never drop rows
 
+    def _dedup_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
-def _group_pages_by_report(rows, limit: int = 0):
-    """Group page rows by report key, concatenating text.
 
-    Returns a list of dicts with a single ``text`` field containing all
-    pages plus metadata carried over from the first page.
+def _keyword_counter() -> Callable[[str], int]:
+    """Return ``f(text) -> number of ESG keyword matches`` (case-insensitive, whole-word prefix).
+
+    Both backends count what ``re.finditer`` over the alternation would:
+    non-overlapping, leftmost, first listed keyword wins at a given offset.
+    """
+    patterns = [rf"\b{kw}" for kw in ESG_KEYWORDS]
+    if hyperscan is not None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns),
+        )
+
+        def count(text: str) -> int:
+            # Hyperscan reports every match end; keep, per start offset, the
+            # first keyword and its longest end, then skip overlapping starts.
+            best: Dict[int, Tuple[int, int]] = {}
+
+            def on_match(pid, start, end, *_):
+                cur = best.get(start)
+                if cur is None or pid < cur[0] or (pid == cur[0] and end > cur[1]):
+                    best[start] = (pid, end)
+
+            db.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+            hits, last_end = 0, -1
+            for start in sorted(best):
+                if start >= last_end:
+                    hits += 1
+                    last_end = best[start][1]
+            return hits
+
+        return count
+
+    # ASCII-only \b and case folding, as Hyperscan applies to the UTF-8 bytes.
+    regex = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.ASCII)
+    return lambda text: sum(1 for _ in regex.finditer(text))
+
+
+# Lines on more than this share of a report's pages (and shorter than
+# BOILERPLATE_MAX_LINE chars) are running headers/footers, not content. Only
+# the first and last BOILERPLATE_EDGE_LINES lines of a page are candidates.
+BOILERPLATE_PAGE_RATIO = 0.6
+BOILERPLATE_MAX_LINE = 120
+BOILERPLATE_EDGE_LINES = 3
+_PARA_BREAK_RE = re.compile(r"\n\s*\n")
+# Paragraphs shorter than this (table rows, labels, single values) are never
+# deduplicated: repeats there are data, not boilerplate.
+DEDUP_MIN_PARA_CHARS = 40
+# Numbers, years and bare units ("2023", "12.5%", "tCO2e") repeat across
+# table pages but are data, so they are never treated as boilerplate.
+_DATA_LINE_RE = re.compile(
+    r"[\d\s.,%()+\-–/]*(?:%|tco2e?|co2e?|mwh|gwh|kwh|m3|tonnes?|t|kg|usd|eur|gbp|\$|€|£)?[\d\s.,%()+\-–/]*",
+    re.IGNORECASE,
+)
+
+
+def _edge_lines(text: str) -> List[Tuple[int, str]]:
+    """``(index, stripped line)`` for the first and last BOILERPLATE_EDGE_LINES non-blank lines of a page."""
+    lines = [(i, ln.strip()) for i, ln in enumerate(text.splitlines()) if ln.strip()]
+    if len(lines) <= 2 * BOILERPLATE_EDGE_LINES:
+        return lines
+    return lines[:BOILERPLATE_EDGE_LINES] + lines[-BOILERPLATE_EDGE_LINES:]
+
+
+def _dedup_pages(texts: List[str]) -> Tuple[List[str], Dict[str, int]]:
+    """Drop running header/footer lines and repeated paragraphs from a report's page texts.
+
+    Header/footer lines are looked for only at the top and bottom of each page,
+    and numeric-only or unit-only lines are always kept. Paragraphs are compared
+    case- and whitespace-insensitively; only the first occurrence in the report
+    is kept, except short or numeric-only ones (table values). Saves LLM input
+    tokens on boilerplate.
     """
-    from collections import OrderedDict
-
-    reports: Dict[str, Dict[str, Any]] = OrderedDict()
-    count = 0
-    for row in rows:
-        k = row.get("k", "")
-        if k not in reports:
-            if limit and count >= limit:
-                break
-            reports[k] = {
-                "k": k,
-                "report_id": row.get("report_id"),
-                "company": row.get("company"),
-                "country": row.get("country"),
-                "sector": row.get("sector"),
-                "industry_group": row.get("industry_group"),
-                "year": row.get("year"),
-                "pages": [],
-            }
-            count += 1
-        reports[k]["pages"].append(row)
-
-    out = []
-    for k, meta in reports.items():
-        # Build a single document from all pages, with page markers
-        parts = []
-        for p in meta["pages"]:
-            page_num = p.get("page", "?")
-            text = (p.get("text") or "").strip()
-            if text:
-                parts.append(f"--- Page {page_num} ---\n{text}")
-        meta["full_text"] = "\n\n".join(parts)
-        meta["page_count"] = len(meta["pages"])
-        del meta["pages"]
-        out.append(meta)
-    return out
-
-
-def _extractions_to_rows(
-    result,
+    stats = {"lines_dropped": 0, "paragraphs_dropped": 0}
+    edges = [_edge_lines(t) for t in texts]
+    boilerplate: set = set()
+    if len(texts) >= 3:
+        line_pages = Counter(line for page in edges for line in {ln for _, ln in page})
+        threshold = BOILERPLATE_PAGE_RATIO * len(texts)
+        boilerplate = {
+            ln for ln, n in line_pages.items()
+            if n > threshold and len(ln) < BOILERPLATE_MAX_LINE and not _DATA_LINE_RE.fullmatch(ln)
+        }
+
+    seen_paras: set = set()
+    out: List[str] = []
+    for text, page_edges in zip(texts, edges):
+        drop = {i for i, ln in page_edges if ln in boilerplate}
+        if drop:
+            stats["lines_dropped"] += len(drop)
+            text = "\n".join(ln for i, ln in enumerate(text.splitlines()) if i not in drop)
+
+        kept_paras = []
+        for para in _PARA_BREAK_RE.split(text):
+            para = para.strip()
+            if not para:
+                continue
+            key = " ".join(para.lower().split())
+            if len(key) < DEDUP_MIN_PARA_CHARS or _DATA_LINE_RE.fullmatch(key):
+                kept_paras.append(para)
+                continue
+            if key in seen_paras:
+                stats["paragraphs_dropped"] += 1
+                continue
+            seen_paras.add(key)
+            kept_paras.append(para)
+        out.append("\n\n".join(kept_paras))
+    return out, stats
+
+
+def _report_meta(
+    pages: List[Dict[str, Any]],
+    dedup: bool = True,
+    keyword_count: Callable[[str], int] | None = None,
+    min_keyword_hits: int = 0,
+) -> Dict[str, Any]:
+    """Build one report document from its page rows (metadata from the first page)."""
+    first = pages[0]
+    page_count = len(pages)
+    if keyword_count is not None and min_keyword_hits > 0:
+        pages = [p for p in pages if keyword_count(p.get("text") or "") >= min_keyword_hits]
+    texts = [(p.get("text") or "").strip() for p in pages]
+    chars_in = sum(len(t) for t in texts)
+    stats: Dict[str, int] = {}
+    if dedup:
+        texts, stats = _dedup_pages(texts)
+
+    # Page-marked text per page; packed into extraction chunks later
+    parts = [
+        (p.get("page", "?"), f"--- Page {p.get('page', '?')} ---\n{text}")
+        for p, text in zip(pages, texts)
+        if text
+    ]
+    return {
+        "k": first.get("k", ""),
+        "report_id": first.get("report_id"),
+        "company": first.get("company"),
+        "country": first.get("country"),
+        "sector": first.get("sector"),
+        "industry_group": first.get("industry_group"),
+        "year": first.get("year"),
+        "parts": parts,
+        "chars": sum(len(part) for _, part in parts),
+        "page_count": page_count,
+        "pages_kept": len(pages),
+        "dedup_stats": {**stats, "chars_in": chars_in, "chars_out": sum(len(t) for t in texts)},
+    }
+
+
+def _iter_reports(rows, limit: int = 0, presorted: bool = True, **meta_kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Stream page rows into per-report documents, one report at a time.
+
+    ``extract_report_pages.py`` writes each report's pages contiguously, so a
+    report is complete as soon as ``k`` changes; only one report's pages are
+    held in memory. With ``presorted=False`` all pages are grouped in a dict
+    first instead. Reports left with no text after page filtering are skipped.
+    ``meta_kwargs`` are passed through to ``_report_meta``.
+    """
+    def _build(pages: List[Dict[str, Any]]) -> Dict[str, Any] | None:
+        meta = _report_meta(pages, **meta_kwargs)
+        if not meta["parts"]:
+            print(f"[langextract-esg] skipping {meta['k']!r}: no pages passed the keyword filter")
+            return None
+        return meta
+
+    if presorted:
+        groups: Iterable[Tuple[str, Iterable[Dict[str, Any]]]] = groupby(rows, key=lambda r: r.get("k", ""))
+    else:
+        by_k: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_k.setdefault(row.get("k", ""), []).append(row)
+        groups = by_k.items()
+
+    emitted = 0
+    seen_keys = set()
+    for k, group in groups:
+        if limit and emitted >= limit:
+            return
+        if k in seen_keys:
+            print(
+                f"[langextract-esg] WARNING: pages for {k!r} are not contiguous; "
+                "it will be extracted in parts (rerun with --unsorted)"
+            )
+        seen_keys.add(k)
+        meta = _build(list(group))
+        if meta is not None:
+            yield meta
+            emitted += 1
+
+
+def _split_long(text: str, max_chars: int) -> Iterator[str]:
+    """Split an over-long page at a paragraph, else sentence, boundary near ``max_chars``."""
+    while len(text) > max_chars:
+        cut = text.rfind("\n\n", 0, max_chars)
+        if cut < max_chars // 2:
+            cut = text.rfind(". ", 0, max_chars) + 1
+        if cut < max_chars // 2:
+            cut = max_chars
+        yield text[:cut].rstrip()
+        text = text[cut:].lstrip()
+    if text:
+        yield text
+
+
+def _pack_pages(parts: List[Tuple[Any, str]], max_chars: int) -> List[Dict[str, Any]]:
+    """Greedily pack whole pages into chunks of at most ``max_chars``.
+
+    Short pages share a chunk; a page is only split when it alone exceeds the
+    limit. Each chunk records the page numbers it covers.
+    """
+    chunks: List[Dict[str, Any]] = []
+    buf: List[str] = []
+    buf_pages: List[Any] = []
+    size = 0
+    for page, text in parts:
+        for piece in _split_long(text, max_chars):
+            add = len(piece) + (2 if buf else 0)
+            if buf and size + add > max_chars:
+                chunks.append({"text": "\n\n".join(buf), "pages": buf_pages})
+                buf, buf_pages, size, add = [], [], 0, len(piece)
+            buf.append(piece)
+            if not buf_pages or buf_pages[-1] != page:
+                buf_pages.append(page)
+            size += add
+    if buf:
+        chunks.append({"text": "\n\n".join(buf), "pages": buf_pages})
+    return chunks
+
+
+class _ExtractionCache:
+    """sqlite-backed memo of per-chunk extractions, keyed by a hash of everything sent to the model.
+
+    Only the main thread touches the connection.
+    """
+
+    def __init__(self, path: Path, fingerprint: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("CREATE TABLE IF NOT EXISTS extractions (key TEXT PRIMARY KEY, items BLOB NOT NULL)")
+        self._fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        h = hashlib.blake2b(self._fingerprint, digest_size=16)
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> List[Dict[str, Any]] | None:
+        row = self._db.execute("SELECT items FROM extractions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return orjson.loads(row[0])
+
+    def put(self, key: str, items: List[Dict[str, Any]]) -> None:
+        self._db.execute("INSERT OR REPLACE INTO extractions VALUES (?, ?)", (key, orjson.dumps(items)))
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+
+def _doc_items(doc) -> List[Dict[str, Any]]:
+    """The model-dependent part of a langextract AnnotatedDocument: class, text, attributes per extraction."""
+    return [
+        {
+            "extraction_class": getattr(ext, "extraction_class", None),
+            "extraction_text": getattr(ext, "extraction_text", None),
+            "attributes": getattr(ext, "attributes", None) or {},
+        }
+        for ext in getattr(doc, "extractions", []) or []
+    ]
+
+
+def _items_to_rows(
+    items: List[Dict[str, Any]],
     meta: Dict[str, Any],
+    pages: List[Any] | None,
 ) -> List[Dict[str, Any]]:
-    """Convert a langextract AnnotatedDocument result to flat dicts."""
+    """Flatten extraction items into output rows with report metadata."""
     rows: List[Dict[str, Any]] = []
-    if not result:
-        return rows
-
-    # result is an AnnotatedDocument
-    for ext in getattr(result, "extractions", []) or []:
+    for item in items:
         row = {
             "k": meta.get("k"),
             "report_id": meta.get("report_id"),
@@ -331,17 +521,38 @@ def _extractions_to_rows(
             "sector": meta.get("sector"),
             "industry_group": meta.get("industry_group"),
             "year": meta.get("year"),
-            "extraction_class": getattr(ext, "extraction_class", None),
-            "extraction_text": getattr(ext, "extraction_text", None),
-            "attributes": getattr(ext, "attributes", None) or {},
-            "pillar": ISSUE_TO_PILLAR.get(
-                getattr(ext, "extraction_class", "") or "", ""
-            ),
+            **item,
+            "pillar": ISSUE_TO_PILLAR.get(item["extraction_class"] or "", ""),
+            "source_pages": pages,
         }
         rows.append(row)
     return rows
 
 
+def _completed_in_order(
+    ex: ThreadPoolExecutor,
+    fn: Callable[[Dict[str, Any]], Any],
+    items: Iterable[Dict[str, Any]],
+    max_in_flight: int,
+) -> Iterator[Tuple[Dict[str, Any], Future]]:
+    """Submit ``fn(item)`` for each item, keeping at most ``max_in_flight`` pending.
+
+    Yields ``(item, future)`` pairs in input order once each future is done, so
+    output is reproducible; later items keep running while an earlier one finishes.
+    """
+    pending: Deque[Tuple[Dict[str, Any], Future]] = deque()
+    for item in items:
+        pending.append((item, ex.submit(fn, item)))
+        if len(pending) >= max_in_flight:
+            head = pending.popleft()
+            wait([head[1]])
+            yield head
+    while pending:
+        head = pending.popleft()
+        wait([head[1]])
+        yield head
+
+
 # ── Main ─────────────────────────────────────────────────────────────────
 
 def main() -> int:
@@ -367,7 +578,19 @@ def main() -> int:
     )
     ap.add_argument(
         "--max-workers", type=int, default=2,
-        help="Parallel workers for extraction (keep low for CF API rate limits)",
+        help="Parallel LLM requests per report (keep low for CF API rate limits)",
+    )
+    ap.add_argument(
+        "--report-workers", type=int, default=4,
+        help="Reports extracted concurrently; total in-flight requests ≈ report-workers × max-workers",
+    )
+    ap.add_argument(
+        "--requests-per-minute", type=float, default=0,
+        help="Process-wide LLM request budget for the Cloudflare provider (0 = unlimited)",
+    )
+    ap.add_argument(
+        "--max-concurrent-requests", type=int, default=0,
+        help="Cloudflare provider: one shared pool of in-flight requests across all reports (0 = per-report pools)",
     )
     ap.add_argument(
         "--extraction-passes", type=int, default=1,
@@ -381,6 +604,27 @@ def main() -> int:
         "--limit", type=int, default=0,
         help="Max reports to process (0 = all)",
     )
+    ap.add_argument(
+        "--cache", type=str,
+        default="ml/data/.lx_cache.sqlite",
+        help="Per-chunk extraction cache; unchanged chunks are not re-sent to the model on re-runs",
+    )
+    ap.add_argument(
+        "--no-cache", action="store_true",
+        help="Neither read nor write the extraction cache",
+    )
+    ap.add_argument(
+        "--unsorted", action="store_true",
+        help="Input pages are not grouped by report; load them all and group in memory",
+    )
+    ap.add_argument(
+        "--no-dedup", action="store_true",
+        help="Send page text as-is (skip header/footer and repeated-paragraph removal)",
+    )
+    ap.add_argument(
+        "--min-keyword-hits", type=int, default=0,
+        help="Only send pages with at least this many ESG keyword matches to the LLM (default 0 = send every page)",
+    )
     ap.add_argument(
         "--visualize", action="store_true",
         help="Generate an HTML visualization after extraction",
@@ -395,67 +639,128 @@ def main() -> int:
         print(f"[langextract-esg] ERROR: input not found: {in_path}")
         return 1
 
-    # ── Group pages into per-report documents ────────────────────────────
-    print(f"[langextract-esg] reading {in_path} ...")
-    report_docs = _group_pages_by_report(_read_jsonl(in_path), limit=args.limit)
-    print(f"[langextract-esg] found {len(report_docs)} reports")
+    # ── Stream pages into per-report documents ───────────────────────────
+    print(f"[langextract-esg] streaming reports from {in_path} ...")
+    report_docs = _iter_reports(
+        _read_jsonl(in_path),
+        limit=args.limit,
+        presorted=not args.unsorted,
+        dedup=not args.no_dedup,
+        keyword_count=_keyword_counter() if args.min_keyword_hits > 0 else None,
+        min_keyword_hits=args.min_keyword_hits,
+    )
 
-    if not report_docs:
-        print("[langextract-esg] nothing to process")
-        return 0
+    # ── Run extraction, several reports in flight at once ────────────────
+    lm_params: Dict[str, Any] = {}
+    if args.requests_per_minute > 0:
+        lm_params["requests_per_minute"] = args.requests_per_minute
+    if args.max_concurrent_requests > 0:
+        lm_params["max_concurrent_requests"] = args.max_concurrent_requests
+
+    use_schema_constraints = not _is_cloudflare_model(args.model)
+    cache = None
+    if not args.no_cache:
+        # Any change to the model, prompt, examples or extraction settings changes every key.
+        fingerprint = orjson.dumps(
+            [args.model, PROMPT_DESCRIPTION, repr(EXAMPLES), args.extraction_passes, use_schema_constraints]
+        )
+        cache = _ExtractionCache(Path(args.cache), fingerprint)
+
+    def _extract(meta: Dict[str, Any]):
+        # Chunks never exceed max_char_buffer, so langextract does not re-split them.
+        documents = [
+            lx.data.Document(text=chunk["text"], document_id=f"{meta['k']}#{i}")
+            for i, chunk in enumerate(meta["chunks"])
+            if chunk["items"] is None
+        ]
+        if not documents:
+            return []
+        return list(lx.extract(
+            text_or_documents=documents,
+            prompt_description=PROMPT_DESCRIPTION,
+            examples=EXAMPLES,
+            model_id=args.model,
+            extraction_passes=args.extraction_passes,
+            max_workers=args.max_workers,
+            max_char_buffer=args.max_char_buffer,
+            fence_output=True,
+            # Providers with structured output (e.g. Gemini) get the schema as a
+            # decoding constraint; the Cloudflare provider has none and needs fences.
+            use_schema_constraints=use_schema_constraints,
+            language_model_params=lm_params or None,
+            show_progress=False,  # keyword-only since langextract 1.1.0 (the pinned minimum)
+        ))
+
+    def _chunked(docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for meta in docs:
+            meta["chunks"] = _pack_pages(meta.pop("parts"), args.max_char_buffer)
+            for chunk in meta["chunks"]:
+                chunk["key"] = cache.key(chunk["text"]) if cache else None
+                chunk["items"] = cache.get(chunk["key"]) if cache else None
+            yield meta
 
-    # ── Run extraction per report ────────────────────────────────────────
     total_entities = 0
+    n_reports = 0
     all_annotated = []
+    report_workers = max(1, args.report_workers)
 
-    with out_path.open("w", encoding="utf-8") as out_f:
-        for i, meta in enumerate(report_docs, start=1):
-            text = meta["full_text"]
+    with out_path.open("wb", buffering=WRITE_BUFFER_SIZE) as out_f, ThreadPoolExecutor(max_workers=report_workers) as ex:
+        completed = _completed_in_order(ex, _extract, _chunked(report_docs), max_in_flight=report_workers)
+        for i, (meta, fut) in enumerate(completed, start=1):
+            n_reports = i
             company = meta.get("company") or meta.get("k")
             print(
-                f"[langextract-esg] [{i}/{len(report_docs)}] "
+                f"[langextract-esg] [{i}] "
                 f"{company} ({meta.get('year')}) – "
-                f"{len(text):,} chars, {meta['page_count']} pages"
+                f"{meta['chars']:,} chars, {meta['pages_kept']}/{meta['page_count']} pages, "
+                f"{len(meta['chunks'])} chunks"
             )
 
             try:
-                result = lx.extract(
-                    text_or_documents=text,
-                    prompt_description=PROMPT_DESCRIPTION,
-                    examples=EXAMPLES,
-                    model_id=args.model,
-                    extraction_passes=args.extraction_passes,
-                    max_workers=args.max_workers,
-                    max_char_buffer=args.max_char_buffer,
-                    fence_output=True,
-                    use_schema_constraints=False,
-                )
+                result = fut.result()
             except Exception as exc:
                 print(f"  ⚠ extraction failed: {exc}")
                 continue
 
-            rows = _extractions_to_rows(result, meta)
-            # Deduplicate by (class, text)
-            seen = set()
+            by_id = {doc.document_id: doc for doc in result}
+            rows = []
+            for n, chunk in enumerate(meta["chunks"]):
+                items = chunk["items"]
+                if items is None:
+                    doc = by_id.get(f"{meta['k']}#{n}")
+                    if doc is None:
+                        continue
+                    items = _doc_items(doc)
+                    if cache:
+                        cache.put(chunk["key"], items)
+                rows.extend(_items_to_rows(items, meta, chunk["pages"]))
+            if cache:
+                cache.commit()
+            # Deduplicate by (class, text); only fixed-size digests are kept in the set.
+            seen: set = set()
             deduped = []
             for row in rows:
-                key = (row["extraction_class"], (row["extraction_text"] or "").lower().strip())
+                key = _dedup_key(f"{row['extraction_class']}\x00{(row['extraction_text'] or '').strip().lower()}")
                 if key not in seen:
                     seen.add(key)
                     deduped.append(row)
             rows = deduped
 
-            for row in rows:
-                out_f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            # One write per report; only the main thread writes, so no lock is needed around out_f.
+            out_f.write(b"".join(map(dumps_line, rows)))
             total_entities += len(rows)
-            all_annotated.append(result)
+            if args.visualize:
+                all_annotated.extend(result)
 
             print(f"  ✓ extracted {len(rows)} entities")
 
     print(
         f"\n[langextract-esg] done – "
-        f"{total_entities} entities from {len(report_docs)} reports → {out_path}"
+        f"{total_entities} entities from {n_reports} reports → {out_path}"
     )
+    if cache:
+        print(f"[langextract-esg] cache: {cache.hits} chunk hits, {cache.misses} misses ({args.cache})")
+        cache.close()
 
     # ── Optional visualisation ───────────────────────────────────────────
     if args.visualize and all_annotated:
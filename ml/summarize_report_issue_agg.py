@@ -1,25 +1,24 @@
 from __future__ import annotations
 
 import argparse
-import json
+import heapq
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import orjson
+
+from jsonl import WRITE_BUFFER_SIZE, dumps_line
+
 
 def _load_index(index_path: Path) -> Dict[str, Dict[str, Any]]:
     if not index_path.exists():
         return {}
-    rows = json.loads(index_path.read_text(encoding="utf-8"))
-    out: Dict[str, Dict[str, Any]] = {}
-    for r in rows:
-        k = r.get("k")
-        if k:
-            out[str(k)] = r
-    return out
+    return {str(r["k"]): r for r in orjson.loads(index_path.read_bytes()) if r.get("k")}
 
 
 def _top_items(d: Dict[str, float], n: int) -> List[Tuple[str, float]]:
-    return sorted(d.items(), key=lambda kv: kv[1], reverse=True)[:n]
+    return heapq.nlargest(n, d.items(), key=itemgetter(1))
 
 
 def main() -> int:
@@ -31,7 +30,7 @@ def main() -> int:
     args = ap.parse_args()
 
     agg_path = Path(args.agg)
-    payload = json.loads(agg_path.read_text(encoding="utf-8"))
+    payload = orjson.loads(agg_path.read_bytes())
     by_issue: Dict[str, Dict[str, float]] = payload.get("by_report_issue_score") or {}
     by_pillar: Dict[str, Dict[str, float]] = payload.get("by_report_pillar_score") or {}
 
@@ -41,7 +40,7 @@ def main() -> int:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     written = 0
-    with out_path.open("w", encoding="utf-8") as f:
+    with out_path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
         for k, issues in by_issue.items():
             meta = index.get(k) or {}
             pillars = by_pillar.get(k) or {}
@@ -60,7 +59,7 @@ def main() -> int:
                 "pillar_share": pillar_share,
                 "top_issues": top_issues,
             }
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.write(dumps_line(row))
             written += 1
 
     print(f"[summary] wrote_reports={written} out={out_path}")
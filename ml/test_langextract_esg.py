@@ -0,0 +1,46 @@
+"""Checks for langextract_esg helpers that do not call a model (run with ``pytest ml``)."""
+
+import pytest
+
+lx_esg = pytest.importorskip("langextract_esg")
+
+TEXT = (
+    "Scope 1 and Scope 2 emissions fell 12% (tCO2e); our net-zero target covers GHG emissions.\n"
+    "Health and safety: LTIFR 0.4, no fatalities. Employees received anti-corruption training.\n"
+    "Renewable energy reached 64% of electricity; water withdrawal and hazardous waste decreased.\n"
+    "The Board's audit committee oversees climate-related risks, in line with TCFD and ISSB.\n"
+)
+# Non-overlapping matches: "Health and safety" is one hit, not two.
+EXPECTED = [(TEXT, 24), (TEXT.upper(), 24), (TEXT * 3, 72), ("", 0), ("no relevant words here", 0)]
+
+
+@pytest.fixture(params=["hyperscan", "re"])
+def keyword_count(request, monkeypatch):
+    if request.param == "hyperscan":
+        pytest.importorskip("hyperscan")
+        if lx_esg.hyperscan is None:
+            pytest.skip("langextract_esg loaded without hyperscan")
+    else:
+        monkeypatch.setattr(lx_esg, "hyperscan", None)
+    return lx_esg._keyword_counter()
+
+
+@pytest.mark.parametrize("text,hits", EXPECTED)
+def test_keyword_counter(keyword_count, text, hits):
+    assert keyword_count(text) == hits
+
+
+def test_dedup_pages_keeps_repeated_table_rows():
+    prose = "This report covers the group's operations across all regions and business units."
+    pages = [
+        f"Acme plc Sustainability Report\n\nSection {n}\n\nOverview {n}.\n\n{prose}\n\n"
+        f"Scope 1 emissions\n\n12%\n\n2023\n\nn/a\n\n"
+        f"Notes to table {n}.\n\nSource: site data {n}.\n\nReviewed {n}.\n\nPage {n}"
+        for n in range(1, 5)
+    ]
+    out, stats = lx_esg._dedup_pages(pages)
+    assert stats["paragraphs_dropped"] == 3  # the repeated prose paragraph
+    for text in out:
+        for value in ("Scope 1 emissions", "12%", "2023", "n/a"):
+            assert value in text.split("\n\n")
+    assert sum(prose in text for text in out) == 1
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
 import random
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import torch
-from torch.utils.data import Dataset
+from datasets import Dataset
 from transformers import (
     AutoModelForSequenceClassification,
     AutoTokenizer,
@@ -26,27 +28,48 @@ PILLAR_LABELS = ["E", "S", "G"]
 PILLAR2ID = {k: i for i, k in enumerate(PILLAR_LABELS)}
 
 
-class PillarDataset(Dataset):
-    def __init__(self, rows: List[Dict[str, Any]], tokenizer, max_length: int = 512):
-        self.rows = rows
-        self.tokenizer = tokenizer
-        self.max_length = max_length
-
-    def __len__(self) -> int:
-        return len(self.rows)
-
-    def __getitem__(self, idx: int) -> Dict[str, Any]:
-        r = self.rows[idx]
-        text = str(r.get("text") or "")
-        label = r.get("pillar_id")
-        enc = self.tokenizer(
-            text,
-            truncation=True,
-            max_length=self.max_length,
-        )
-        enc["labels"] = int(label)
+def _tokenized_dataset(
+    rows: List[Dict[str, Any]],
+    tokenizer,
+    max_length: int,
+    cache_dir: Optional[Path],
+    split: str,
+) -> Dataset:
+    """Tokenize rows into an Arrow-backed ``datasets.Dataset`` (input_ids, attention_mask, labels, length).
+
+    With ``cache_dir`` set, the encoded table is written to an Arrow file keyed on
+    (tokenizer, max_length, texts, labels), so unchanged reruns memory-map it instead
+    of re-tokenizing.
+    """
+    texts = [str(r.get("text") or "") for r in rows]
+    labels = [int(r["pillar_id"]) for r in rows]
+
+    cache_file = None
+    if cache_dir is not None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{tokenizer.name_or_path}\0{max_length}\0".encode("utf-8"))
+        for text, label in zip(texts, labels):
+            h.update(text.encode("utf-8"))
+            h.update(b"\0%d\0" % label)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = str(cache_dir / f"{split}-{h.hexdigest()}.arrow")
+
+    def tokenize(batch: Dict[str, List[Any]]) -> Dict[str, Any]:
+        enc = tokenizer(batch["text"], truncation=True, max_length=max_length)
+        enc["length"] = [len(ids) for ids in enc["input_ids"]]
         return enc
 
+    ds = Dataset.from_dict({"text": texts, "labels": labels})
+    return ds.map(
+        tokenize,
+        batched=True,
+        batch_size=1000,
+        remove_columns=["text"],
+        cache_file_name=cache_file,
+        load_from_cache_file=cache_file is not None,
+        desc=f"tokenize {split}",
+    )
+
 
 def _split_by_report(rows: List[Dict[str, Any]], seed: int, eval_ratio: float) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     by_report: Dict[str, List[Dict[str, Any]]] = {}
@@ -69,24 +92,61 @@ def _split_by_report(rows: List[Dict[str, Any]], seed: int, eval_ratio: float) -
     return train_rows, eval_rows
 
 
+_ENCODER_LAYER_RE = re.compile(r"(?:^|\.)encoder\.layer\.(\d+)\.")
+
+
+def _freeze_lower_layers(model, n_layers: int) -> None:
+    """Freeze the embeddings and encoder layers 0..n_layers-1; upper layers, pooler and head stay trainable."""
+    for name, param in model.named_parameters():
+        m = _ENCODER_LAYER_RE.search(name)
+        if ".embeddings." in f".{name}" or (m and int(m.group(1)) < n_layers):
+            param.requires_grad = False
+
+
+def _dynamic_max_length(
+    rows: List[Dict[str, Any]],
+    tokenizer,
+    quantile: float,
+    seed: int,
+    cap: int = 512,
+    sample_size: int = 5000,
+) -> int:
+    """Pick max_length as the given token-length quantile of (a sample of) the rows, rounded up to a multiple of 8."""
+    sample = rows if len(rows) <= sample_size else random.Random(seed).sample(rows, sample_size)
+    ids = tokenizer([str(r.get("text") or "") for r in sample], truncation=False)["input_ids"]
+    lengths = np.fromiter((len(x) for x in ids), dtype=np.int64, count=len(ids))
+    p50, p95, p99 = np.quantile(lengths, [0.5, 0.95, 0.99])
+    print(f"[train] token_length p50={p50:.0f} p95={p95:.0f} p99={p99:.0f} (n={len(lengths)})")
+    chosen = int(math.ceil(float(np.quantile(lengths, quantile)) / 8.0) * 8)
+    return max(8, min(cap, chosen))
+
+
+def _confusion_matrix(preds: np.ndarray, labels: np.ndarray, n_classes: int) -> np.ndarray:
+    """[true, pred] count matrix in one O(N) pass.
+
+    np.bincount already runs the whole count in C; a JIT-compiled loop would
+    not beat it and a prange version would race on the shared cells.
+    """
+    return np.bincount(labels * n_classes + preds, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
 def _compute_metrics(eval_pred):
     logits, labels = eval_pred
-    preds = np.argmax(logits, axis=-1)
+    preds = np.argmax(logits, axis=-1).astype(np.int64)
     labels = labels.astype(np.int64)
 
     acc = float((preds == labels).mean()) if len(labels) else 0.0
 
-    f1s = []
-    for lab in range(len(PILLAR_LABELS)):
-        tp = int(((preds == lab) & (labels == lab)).sum())
-        fp = int(((preds == lab) & (labels != lab)).sum())
-        fn = int(((preds != lab) & (labels == lab)).sum())
-        prec = tp / (tp + fp) if (tp + fp) else 0.0
-        rec = tp / (tp + fn) if (tp + fn) else 0.0
-        f1 = (2 * prec * rec / (prec + rec)) if (prec + rec) else 0.0
-        f1s.append(f1)
+    cm = _confusion_matrix(preds, labels, len(PILLAR_LABELS))
+    tp = np.diag(cm).astype(np.float64)
+    fp = cm.sum(axis=0) - tp
+    fn = cm.sum(axis=1) - tp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prec = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        rec = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        f1 = np.where(prec + rec > 0, 2 * prec * rec / (prec + rec), 0.0)
 
-    return {"accuracy": acc, "f1_macro": float(np.mean(f1s))}
+    return {"accuracy": acc, "f1_macro": float(f1.mean())}
 
 
 def main() -> int:
@@ -100,9 +160,28 @@ def main() -> int:
     ap.add_argument("--lr", type=float, default=2e-5, help="Learning rate")
     ap.add_argument("--batch-size", type=int, default=8, help="Per-device train batch size")
     ap.add_argument("--freeze-encoder", action="store_true", help="Freeze the BERT encoder and train only the classifier head")
+    ap.add_argument("--freeze-layers", type=int, default=0, help="Freeze embeddings + the lowest N encoder layers (0 = none)")
+    ap.add_argument("--gradient-checkpointing", action="store_true", help="Recompute activations in backward to save memory")
     ap.add_argument("--limit", type=int, default=0, help="Max rows to use (0 = no limit)")
+    ap.add_argument("--cache-dir", type=str, default="ml/data/.tok_cache", help="Arrow cache for tokenized splits ('' = off)")
+    ap.add_argument("--max-length", type=int, default=0, help="Max tokens per example (0 = derive from --length-quantile)")
+    ap.add_argument("--length-quantile", type=float, default=0.95, help="Token-length quantile used when --max-length is 0")
+    ap.add_argument(
+        "--precision",
+        choices=["auto", "fp32", "bf16", "fp16"],
+        default="auto",
+        help="Mixed-precision mode (auto = bf16 if the GPU supports it, else fp16 on GPU, fp32 on CPU)",
+    )
+    ap.add_argument("--torch-compile", action="store_true", help="Compile the model with torch.compile (inductor)")
     args = ap.parse_args()
 
+    cuda = torch.cuda.is_available()
+    # TF32 matmuls need Ampere (sm_80) or newer; TrainingArguments rejects tf32=True on older GPUs.
+    tf32 = cuda and torch.cuda.get_device_capability()[0] >= 8
+    precision = args.precision
+    if precision == "auto":
+        precision = ("bf16" if torch.cuda.is_bf16_supported() else "fp16") if cuda else "fp32"
+
     in_path = Path(args.in_path)
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -134,11 +213,28 @@ def main() -> int:
         for name, param in model.named_parameters():
             if not name.startswith("classifier."):
                 param.requires_grad = False
-
-    data_collator = DataCollatorWithPadding(tokenizer=tokenizer)
-
-    train_ds = PillarDataset(train_rows, tokenizer=tokenizer)
-    eval_ds = PillarDataset(eval_rows, tokenizer=tokenizer) if eval_rows else None
+    elif args.freeze_layers and args.freeze_layers > 0:
+        _freeze_lower_layers(model, args.freeze_layers)
+
+    n_trainable = sum(p.numel() for p in model.parameters() if p.requires_grad)
+    n_total = sum(p.numel() for p in model.parameters())
+    print(f"[train] trainable_params={n_trainable:,}/{n_total:,}")
+
+    # Multiple-of-8 padding keeps shapes Tensor Core friendly.
+    data_collator = DataCollatorWithPadding(tokenizer=tokenizer, pad_to_multiple_of=8)
+
+    max_length = args.max_length
+    if not max_length or max_length <= 0:
+        max_length = _dynamic_max_length(train_rows, tokenizer, quantile=args.length_quantile, seed=args.seed)
+    print(f"[train] max_length={max_length}")
+
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    train_ds = _tokenized_dataset(train_rows, tokenizer, max_length=max_length, cache_dir=cache_dir, split="train")
+    eval_ds = (
+        _tokenized_dataset(eval_rows, tokenizer, max_length=max_length, cache_dir=cache_dir, split="eval")
+        if eval_rows
+        else None
+    )
 
     train_args = TrainingArguments(
         output_dir=str(out_dir),
@@ -154,8 +250,23 @@ def main() -> int:
         seed=args.seed,
         data_seed=args.seed,
         remove_unused_columns=True,
+        # Batch similar-length rows together so each batch pads to its own max, not ~max_length.
+        group_by_length=True,
+        length_column_name="length",
         logging_steps=50,
+        # AMP keeps fp32 master weights; only activations/matmuls run in reduced precision.
+        bf16=precision == "bf16",
+        fp16=precision == "fp16",
+        tf32=True if tf32 else None,
+        optim="adamw_torch_fused" if cuda else "adamw_torch",
+        torch_compile=args.torch_compile,
+        torch_compile_backend="inductor" if args.torch_compile else None,
+        dataloader_pin_memory=cuda,
+        gradient_checkpointing=args.gradient_checkpointing,
+        # Non-reentrant checkpointing works with frozen (no-grad) embeddings.
+        gradient_checkpointing_kwargs={"use_reentrant": False} if args.gradient_checkpointing else None,
     )
+    print(f"[train] precision={precision} torch_compile={args.torch_compile}")
 
     trainer = Trainer(
         model=model,
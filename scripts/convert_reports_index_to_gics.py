@@ -18,15 +18,16 @@ If you add new SICS industries to the index, extend SICS_INDUSTRY_TO_GICS below.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, Tuple
 
+from reports_index import load_rows, write_rows
+
 
 IndexRow = Dict[str, object]
 
 
-GICS_SECTORS = {
+GICS_SECTORS = frozenset({
     "Energy",
     "Materials",
     "Industrials",
@@ -38,11 +39,11 @@ GICS_SECTORS = {
     "Communication Services",
     "Utilities",
     "Real Estate",
-}
+})
 
 # Industry Group names reflect the official GICS hierarchy (post-2018 sector changes).
 # We allow the 2023 retail renames commonly seen in data vendors.
-GICS_INDUSTRY_GROUPS = {
+GICS_INDUSTRY_GROUPS = frozenset({
     "Energy",
     "Materials",
     "Capital Goods",
@@ -69,7 +70,7 @@ GICS_INDUSTRY_GROUPS = {
     "Media & Entertainment",
     "Utilities",
     "Real Estate",
-}
+})
 
 
 def _norm_key(s: str) -> str:
@@ -164,6 +165,11 @@ SICS_INDUSTRY_TO_GICS: Dict[str, Tuple[str, str]] = {
 }
 
 
+# Lookup keyed the same way rows are normalized, so dash/whitespace variants
+# in the mapping keys still match.
+_SICS_INDEX: Dict[str, Tuple[str, str]] = {_norm_key(k): v for k, v in SICS_INDUSTRY_TO_GICS.items()}
+
+
 # Optional company-level overrides for known mismatches in the source classification.
 # Key is the *exact* company string in reportsIndex.json ("c" field).
 COMPANY_TO_GICS_OVERRIDE: Dict[str, Tuple[str, str]] = {
@@ -175,11 +181,12 @@ COMPANY_TO_GICS_OVERRIDE: Dict[str, Tuple[str, str]] = {
 
 def main() -> int:
     index_path = Path("src/data/reportsIndex.json")
-    rows = json.loads(index_path.read_text(encoding="utf-8"))
+    rows = load_rows(index_path)
     if not isinstance(rows, list):
         raise SystemExit(f"Index must be a list: {index_path}")
 
     missing: Dict[str, int] = {}
+    changed = False
     for r in rows:
         if not isinstance(r, dict):
             raise SystemExit("Index rows must be objects")
@@ -198,19 +205,22 @@ def main() -> int:
         sics_industry_raw = str(r.get("si") or current_group or "")
         sics_industry = _norm_key(sics_industry_raw)
 
+        before = (r.get("s"), r.get("i"), r.get("ss"), r.get("si"))
+
         # Preserve original labels once.
         r.setdefault("ss", sics_sector)
         r.setdefault("si", sics_industry_raw)
 
         gics = COMPANY_TO_GICS_OVERRIDE.get(company)
         if gics is None:
-            gics = SICS_INDUSTRY_TO_GICS.get(sics_industry)
+            gics = _SICS_INDEX.get(sics_industry)
 
         if gics is None:
             missing[sics_industry] = missing.get(sics_industry, 0) + 1
             # Keep placeholders to avoid losing data if you want to inspect after a partial run.
             r["s"] = "Unknown"
             r["i"] = "Unknown"
+            changed = True
             continue
 
         gics_sector, gics_group = gics
@@ -221,6 +231,7 @@ def main() -> int:
 
         r["s"] = gics_sector
         r["i"] = gics_group
+        changed = changed or before != (r["s"], r["i"], r["ss"], r["si"])
 
     if missing:
         missing_items = "\n".join(f"- {k!r}: {v}" for k, v in sorted(missing.items()))
@@ -228,7 +239,11 @@ def main() -> int:
             "Missing SICS->GICS mappings for the following SICS industries:\n" + missing_items
         )
 
-    index_path.write_text(json.dumps(rows, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if not changed:
+        print(f"Unchanged: {index_path}")  # noqa: T201
+        return 0
+
+    write_rows(index_path, rows)
     print(f"Updated: {index_path}")  # noqa: T201
     return 0
 
@@ -1,18 +1,17 @@
-import base64, os
+import base64, mmap, os
 
 pub = os.path.join(os.path.dirname(__file__), '..', 'public')
-with open(os.path.join(pub, 'favicon-32x32.png'), 'rb') as f:
-    b64 = base64.b64encode(f.read()).decode()
-
-href = 'data:image/png;base64,' + b64
-svg = (
-    '<svg xmlns="http://www.w3.org/2000/svg" '
-    'xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 32 32">\n'
-    '  <image width="32" height="32" xlink:href="' + href + '"/>\n'
-    '</svg>\n'
-)
+with open(os.path.join(pub, 'favicon-32x32.png'), 'rb') as f, \
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as png:
+    b64 = base64.b64encode(png)
 
 out = os.path.join(pub, 'favicon.svg')
-with open(out, 'w') as f:
-    f.write(svg)
+with open(out, 'wb') as f:
+    f.write(
+        b'<svg xmlns="http://www.w3.org/2000/svg" '
+        b'xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 32 32">\n'
+        b'  <image width="32" height="32" xlink:href="data:image/png;base64,'
+    )
+    f.write(b64)
+    f.write(b'"/>\n</svg>\n')
 print('favicon.svg written')
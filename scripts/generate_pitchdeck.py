@@ -6,6 +6,16 @@ from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import AutoShapeType, Shape
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+from itertools import groupby
+from xml.sax.saxutils import escape
 import os
 
 # ── Colour palette ──────────────────────────────────────────────────────────
@@ -21,6 +31,24 @@ ORANGE        = RGBColor(0xF9, 0x73, 0x16)
 BLUE_ACCENT   = RGBColor(0x38, 0xBD, 0xF8)
 RED_ACCENT    = RGBColor(0xF4, 0x3F, 0x5E)
 
+# Hex strings for the XML templates below, formatted once per palette colour.
+_HEX = {c: str(c) for c in (DARK_BG, CARD_BG, ACCENT, ACCENT_DIM, WHITE, LIGHT_GRAY, MID_GRAY,
+                            GOLD, ORANGE, BLUE_ACCENT, RED_ACCENT)}
+
+# ── EMU conversions ─────────────────────────────────────────────────────────
+# Every font size in the deck, converted once (and to the centipoints the XML templates take);
+# inch offsets are memoized as plain ints, which is all the templates and shape factories need.
+_PT = {n: Pt(n) for n in (9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 22, 24, 28, 40, 42, 44, 52)}
+_SZ = {n: pt.centipoints for n, pt in _PT.items()}
+_IN = lru_cache(maxsize=None)(lambda inches: int(Inches(inches)))
+
+
+@lru_cache(maxsize=None)
+def _steps(origin, step, n):
+    """Offsets of n evenly spaced grid columns/rows, in EMU."""
+    return tuple(_IN(origin) + _IN(i * step) for i in range(n))
+
+
 SLIDE_WIDTH   = Inches(13.333)
 SLIDE_HEIGHT  = Inches(7.5)
 
@@ -28,8 +56,96 @@ prs = Presentation()
 prs.slide_width  = SLIDE_WIDTH
 prs.slide_height = SLIDE_HEIGHT
 
+# Every slide uses the blank layout; drop the template's other layouts so they
+# are not written into the deck.
+BLANK_LAYOUT = prs.slide_layouts.get_by_name("Blank")
+for _layout in [l for l in prs.slide_layouts if l is not BLANK_LAYOUT]:
+    prs.slide_layouts.remove(_layout)
+
+# Likewise the template's printer settings and its thumbnail (a picture of the empty
+# default deck); parts no longer related from anywhere are not saved.
+for _rels in (prs.part.package._rels, prs.part.rels):
+    for _rId in [rId for rId, rel in _rels.items() if rel.reltype in (RT.THUMBNAIL, RT.PRINTER_SETTINGS)]:
+        _rels.pop(_rId)
+
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
+def _autoshape_prototype(autoshape_type_id):
+    """(basename, <p:sp>) for a preset geometry, built once and deep-copied per placement."""
+    shape_type = AutoShapeType(autoshape_type_id)
+    return shape_type.basename, CT_Shape.new_autoshape_sp(0, "", shape_type.prst, 0, 0, 0, 0)
+
+
+class _SlideShapes:
+    """A new blank slide whose shapes are built detached and appended to its shape tree in one go.
+
+    Shape ids and names follow python-pptx's own add_shape/add_textbox numbering.
+    """
+
+    def __init__(self):
+        self.slide = prs.slides.add_slide(BLANK_LAYOUT)
+        self.background = self.slide.background
+        self._next_id = self.slide.shapes._spTree.max_shape_id + 1
+        self._elements = []
+
+    def next_id(self):
+        id_ = self._next_id
+        self._next_id += 1
+        return id_
+
+    def append(self, sp):
+        self._elements.append(sp)
+        return sp
+
+    def append_xml(self, xml):
+        """Queue a shape as an XML string (no namespace declarations); adjacent ones are parsed together."""
+        self._elements.append(xml)
+
+    @staticmethod
+    def _parsed(items):
+        """Yield items as elements, parsing each run of adjacent XML strings in a single parse_xml call."""
+        for is_xml, run in groupby(items, key=lambda item: isinstance(item, str)):
+            if is_xml:
+                yield from list(parse_xml(_SHAPES_XML_HEAD + "".join(run) + "</p:spTree>"))
+            else:
+                yield from run
+
+    def add_shape(self, autoshape_type_id, left, top, width, height):
+        basename, proto = _autoshape_prototype(autoshape_type_id)
+        id_ = self.next_id()
+        sp = deepcopy(proto)
+        c_nv_pr = sp.nvSpPr.cNvPr
+        c_nv_pr.id, c_nv_pr.name = id_, f"{basename} {id_ - 1}"
+        xfrm = sp.spPr.xfrm
+        xfrm.off.x, xfrm.off.y, xfrm.ext.cx, xfrm.ext.cy = left, top, width, height
+        return Shape(self.append(sp), None)
+
+    def add_textbox(self, left, top, width, height):
+        id_ = self.next_id()
+        return Shape(self.append(CT_Shape.new_textbox_sp(id_, f"TextBox {id_ - 1}", left, top, width, height)), None)
+
+    @contextmanager
+    def group(self, left, top, width, height):
+        """Collect the shapes added inside the block into one <p:grpSp>.
+
+        Child offset/extent equal the group's own, so children keep slide coordinates.
+        """
+        id_ = self.next_id()
+        outer, self._elements = self._elements, []
+        try:
+            yield
+        finally:
+            children, self._elements = self._elements, outer
+        grp = parse_xml(_GROUP_XML(id=id_, n=id_ - 1, x=left, y=top, cx=width, cy=height))
+        grp.extend(self._parsed(children))
+        self.append(grp)
+
+    def commit(self):
+        self.slide.shapes._spTree.extend(self._parsed(self._elements))
+        self._elements = []
+
+
 def _solid_bg(slide, color):
     bg = slide.background
     fill = bg.fill
@@ -37,38 +153,71 @@ def _solid_bg(slide, color):
     fill.fore_color.rgb = color
 
 
+_LN_NONE = '<a:ln><a:noFill/></a:ln>'
+# XML templates are bound str.format methods, called with keyword fields.
+_LN_COLOR = '<a:ln w="{w}"><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill></a:ln>'.format
+_SHAPE_FILL_XML = (
+    '<p:spPr ' + nsdecls("a", "p") + '><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>{ln}</p:spPr>').format
+
+
+def _fill_shape(shape, fill_color, line_color=None, line_w=None):
+    """Give a fresh autoshape a solid fill and either a coloured outline or none."""
+    ln = _LN_COLOR(w=line_w or Pt(1), rgb=_HEX[line_color]) if line_color else _LN_NONE
+    shape._element.spPr.extend(list(parse_xml(_SHAPE_FILL_XML(rgb=_HEX[fill_color], ln=ln))))
+    return shape
+
+
 def _add_rect(slide, left, top, width, height, fill_color, line_color=None, line_w=None):
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
-    if line_color:
-        shape.line.color.rgb = line_color
-        shape.line.width = line_w or Pt(1)
-    else:
-        shape.line.fill.background()
+    shape = _fill_shape(slide.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height),
+                        fill_color, line_color, line_w)
     # Make corners subtle
     shape.adjustments[0] = 0.04
     return shape
 
 
+_GROUP_XML = (
+    '<p:grpSp ' + nsdecls("a", "p") + '><p:nvGrpSpPr><p:cNvPr id="{id}" name="Group {n}"/><p:cNvGrpSpPr/>'
+    '<p:nvPr/></p:nvGrpSpPr><p:grpSpPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+    '<a:chOff x="{x}" y="{y}"/><a:chExt cx="{cx}" cy="{cy}"/></a:xfrm></p:grpSpPr></p:grpSp>'
+).format
+
+# Wrapper that declares the a:/p: prefixes for a batch of shape strings.
+_SHAPES_XML_HEAD = '<p:spTree ' + nsdecls("a", "p") + '>'
+
+# Single-paragraph word-wrapped textbox, as add_textbox + paragraph font settings would produce it.
+# Text set no typeface of its own: the master's text styles resolve it to the theme's minor font,
+# Calibri in python-pptx's default template.
+_TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {n}"/><p:cNvSpPr txBox="1"/>'
+    '<p:nvPr/></p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr><p:txBody>'
+    '<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/><a:p><a:pPr algn="{algn}">'
+    '<a:defRPr sz="{sz}" b="{b}"><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
+    '{latin}</a:defRPr></a:pPr>{runs}</a:p></p:txBody></p:sp>'
+).format
+
+
+# The deck's strings repeat (fonts, labels, status pills); escape each once.
+_esc = lru_cache(maxsize=512)(escape)
+
+
+def _runs_xml(text):
+    return "<a:br/>".join(f"<a:r><a:t>{_esc(line)}</a:t></a:r>" for line in text.split("\n"))
+
+
 def _add_text(slide, left, top, width, height, text, font_size=18,
-              color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name="Calibri"):
-    txbox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txbox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.color.rgb = color
-    p.font.bold = bold
-    p.font.name = font_name
-    p.alignment = alignment
-    return txbox
+              color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name=None):
+    id_ = slide.next_id()
+    slide.append_xml(_TEXTBOX_XML(
+        id=id_, n=id_ - 1, x=left, y=top, cx=width, cy=height,
+        algn=alignment.xml_value, sz=_SZ[font_size], b=int(bold), rgb=_HEX[color],
+        latin=f'<a:latin typeface="{_esc(font_name)}"/>' if font_name else "", runs=_runs_xml(text),
+    ))
 
 
 def _add_bullet_frame(slide, left, top, width, height, items,
                       font_size=16, color=LIGHT_GRAY, bullet_color=ACCENT, spacing=Pt(8)):
-    txbox = slide.shapes.add_textbox(left, top, width, height)
+    txbox = slide.add_textbox(left, top, width, height)
     tf = txbox.text_frame
     tf.word_wrap = True
     for i, item in enumerate(items):
@@ -77,82 +226,107 @@ def _add_bullet_frame(slide, left, top, width, height, items,
         else:
             p = tf.add_paragraph()
         p.text = item
-        p.font.size = Pt(font_size)
+        p.font.size = _PT[font_size]
         p.font.color.rgb = color
-        p.font.name = "Calibri"
         p.space_after = spacing
         p.level = 0
     return txbox
 
 
+# Filled, outline-free autoshape with one line of bold centred text, as add_shape plus
+# text-frame settings would produce it; used for status pills and numbered dots.
+_LABEL_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>{geom}'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln></p:spPr><p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="2"><a:schemeClr val="accent1"/>'
+    '</a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style><p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"{wrap}/><a:lstStyle/><a:p><a:pPr algn="ctr"><a:defRPr sz="{sz}" b="1">'
+    '<a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill></a:defRPr></a:pPr><a:r><a:t>{text}</a:t></a:r>'
+    '</a:p></p:txBody></p:sp>'
+).format
+_PILL_GEOM = '<a:prstGeom prst="roundRect"><a:avLst><a:gd name="adj" fmla="val 50000"/></a:avLst></a:prstGeom>'
+_DOT_GEOM = '<a:prstGeom prst="ellipse"><a:avLst/></a:prstGeom>'
+
+
 def _pill(slide, left, top, text, fill=ACCENT, text_color=DARK_BG, width=None, font_size=11):
-    w = width or Inches(1.6)
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, w, Inches(0.35))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill
-    shape.line.fill.background()
-    shape.adjustments[0] = 0.5  # full round
-    tf = shape.text_frame
-    tf.word_wrap = False
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.color.rgb = text_color
-    p.font.bold = True
-    p.font.name = "Calibri"
-    p.alignment = PP_ALIGN.CENTER
-    return shape
+    id_ = slide.next_id()
+    slide.append_xml(_LABEL_XML(
+        id=id_, name=f"Rounded Rectangle {id_ - 1}", x=left, y=top, cx=width or _IN(1.6), cy=_IN(0.35),
+        geom=_PILL_GEOM, fill=_HEX[fill], wrap=' wrap="none"',
+        sz=_SZ[font_size], rgb=_HEX[text_color], text=_esc(text),
+    ))
+
+
+def _dot(slide, left, top, diameter, fill, text, font_size=18, text_color=DARK_BG):
+    id_ = slide.next_id()
+    slide.append_xml(_LABEL_XML(
+        id=id_, name=f"Oval {id_ - 1}", x=left, y=top, cx=diameter, cy=diameter,
+        geom=_DOT_GEOM, fill=_HEX[fill], wrap="",
+        sz=_SZ[font_size], rgb=_HEX[text_color], text=_esc(text),
+    ))
+
+
+@contextmanager
+def _card(slide, left, top, width, height, line_color=None, line_w=None):
+    """Rounded card background plus everything added in the block, as one group shape."""
+    with slide.group(left, top, width, height):
+        _add_rect(slide, left, top, width, height, CARD_BG, line_color, line_w)
+        yield
 
 
 def _section_tag(slide, left, top, label):
-    _add_text(slide, left, top, Inches(4), Inches(0.35), label.upper(),
+    _add_text(slide, left, top, _IN(4), _IN(0.35), label.upper(),
               font_size=11, color=ACCENT, bold=True)
 
 
 def _slide_number(slide, num):
-    _add_text(slide, Inches(12.4), Inches(7.05), Inches(0.8), Inches(0.3),
+    _add_text(slide, _IN(12.4), _IN(7.05), _IN(0.8), _IN(0.3),
               str(num), font_size=10, color=MID_GRAY, alignment=PP_ALIGN.RIGHT)
 
 
+def _content_slide(tag, title):
+    """New dark slide with the standard section tag and 40pt headline."""
+    slide = _SlideShapes()
+    _solid_bg(slide, DARK_BG)
+    _section_tag(slide, _IN(1), _IN(0.6), tag)
+    _add_text(slide, _IN(1), _IN(1.1), _IN(11), _IN(0.8), title, font_size=40, bold=True)
+    return slide
+
+
 # ── SLIDE 1 – TITLE ────────────────────────────────────────────────────────
 def slide_title():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
+    slide = _SlideShapes()
     _solid_bg(slide, DARK_BG)
 
     # Decorative accent line
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                  Inches(1), Inches(1.8), Inches(0.06), Inches(1.5))
-    line.fill.solid(); line.fill.fore_color.rgb = ACCENT
-    line.line.fill.background()
+    _fill_shape(slide.add_shape(MSO_SHAPE.RECTANGLE, _IN(1), _IN(1.8), _IN(0.06), _IN(1.5)), ACCENT)
 
-    _add_text(slide, Inches(1.4), Inches(1.8), Inches(10), Inches(0.9),
+    _add_text(slide, _IN(1.4), _IN(1.8), _IN(10), _IN(0.9),
               "SustainabilitySignals", font_size=52, color=WHITE, bold=True)
 
-    _add_text(slide, Inches(1.4), Inches(2.7), Inches(10), Inches(0.6),
+    _add_text(slide, _IN(1.4), _IN(2.7), _IN(10), _IN(0.6),
               "Transparent ESG Ratings from Disclosure Evidence", font_size=24, color=ACCENT)
 
-    _add_text(slide, Inches(1.4), Inches(3.7), Inches(8), Inches(0.8),
+    _add_text(slide, _IN(1.4), _IN(3.7), _IN(8), _IN(0.8),
               "AI-powered platform that reads 950+ European sustainability reports,\n"
               "scores disclosure quality, and extracts structured ESG data — all evidence-grounded.",
               font_size=16, color=LIGHT_GRAY)
 
     # Bottom bar
-    _add_text(slide, Inches(1.4), Inches(5.8), Inches(5), Inches(0.4),
+    _add_text(slide, _IN(1.4), _IN(5.8), _IN(5), _IN(0.4),
               "Nikhil Reddy Gogu  ·  nikhil.chat  ·  Feb 2026",
               font_size=13, color=MID_GRAY)
 
-    _pill(slide, Inches(9.5), Inches(5.82), "Student Project", fill=CARD_BG, text_color=ACCENT, width=Inches(1.8))
+    _pill(slide, _IN(9.5), _IN(5.82), "Student Project", fill=CARD_BG, text_color=ACCENT, width=_IN(1.8))
 
-    _slide_number(slide, 1)
+    return slide
 
 
 # ── SLIDE 2 – THE PROBLEM ──────────────────────────────────────────────────
 def slide_problem():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "The Problem")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "ESG ratings are a black box", font_size=40, bold=True)
+    slide = _content_slide("The Problem", "ESG ratings are a black box")
 
     problems = [
         ("Opaque Methodologies",
@@ -166,31 +340,24 @@ def slide_problem():
          GOLD),
     ]
 
-    for i, (title, desc, accent) in enumerate(problems):
-        left = Inches(1) + Inches(i * 3.8)
-        card = _add_rect(slide, left, Inches(2.5), Inches(3.5), Inches(3.8), CARD_BG, accent, Pt(1.5))
+    for left, (title, desc, accent) in zip(_steps(1, 3.8, len(problems)), problems):
+        with _card(slide, left, _IN(2.5), _IN(3.5), _IN(3.8), accent, Pt(1.5)):
+            # Accent dot
+            _fill_shape(slide.add_shape(MSO_SHAPE.OVAL, left + _IN(0.3), _IN(2.85), _IN(0.18), _IN(0.18)), accent)
 
-        # Accent dot
-        dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, left + Inches(0.3), Inches(2.85), Inches(0.18), Inches(0.18))
-        dot.fill.solid(); dot.fill.fore_color.rgb = accent; dot.line.fill.background()
+            _add_text(slide, left + _IN(0.3), _IN(3.15), _IN(2.9), _IN(0.5),
+                      title, font_size=20, bold=True, color=WHITE)
+            _add_text(slide, left + _IN(0.3), _IN(3.7), _IN(2.9), _IN(2.2),
+                      desc, font_size=14, color=LIGHT_GRAY)
 
-        _add_text(slide, left + Inches(0.3), Inches(3.15), Inches(2.9), Inches(0.5),
-                  title, font_size=20, bold=True, color=WHITE)
-        _add_text(slide, left + Inches(0.3), Inches(3.7), Inches(2.9), Inches(2.2),
-                  desc, font_size=14, color=LIGHT_GRAY)
-
-    _slide_number(slide, 2)
+    return slide
 
 
 # ── SLIDE 3 – SOLUTION ─────────────────────────────────────────────────────
 def slide_solution():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Our Solution")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Evidence-grounded ESG intelligence", font_size=40, bold=True)
+    slide = _content_slide("Our Solution", "Evidence-grounded ESG intelligence")
 
-    _add_text(slide, Inches(1), Inches(2.1), Inches(10), Inches(0.6),
+    _add_text(slide, _IN(1), _IN(2.1), _IN(10), _IN(0.6),
               "SustainabilitySignals reads the actual report, extracts evidence, and shows its work.",
               font_size=17, color=LIGHT_GRAY)
 
@@ -201,34 +368,28 @@ def slide_solution():
         ("💬", "Chat", "Ask questions about any report with AI grounded in the actual document text — not hallucinations."),
     ]
 
-    for i, (icon, label, desc) in enumerate(pillars):
-        left = Inches(1) + Inches(i * 3)
-        _add_rect(slide, left, Inches(3.1), Inches(2.7), Inches(3.2), CARD_BG)
-
-        _add_text(slide, left + Inches(0.3), Inches(3.3), Inches(0.6), Inches(0.6),
-                  icon, font_size=28)
-        _add_text(slide, left + Inches(0.3), Inches(3.95), Inches(2.1), Inches(0.4),
-                  label, font_size=22, bold=True, color=ACCENT)
-        _add_text(slide, left + Inches(0.3), Inches(4.45), Inches(2.1), Inches(1.6),
-                  desc, font_size=13, color=LIGHT_GRAY)
+    for left, (icon, label, desc) in zip(_steps(1, 3, len(pillars)), pillars):
+        with _card(slide, left, _IN(3.1), _IN(2.7), _IN(3.2)):
+            _add_text(slide, left + _IN(0.3), _IN(3.3), _IN(0.6), _IN(0.6),
+                      icon, font_size=28)
+            _add_text(slide, left + _IN(0.3), _IN(3.95), _IN(2.1), _IN(0.4),
+                      label, font_size=22, bold=True, color=ACCENT)
+            _add_text(slide, left + _IN(0.3), _IN(4.45), _IN(2.1), _IN(1.6),
+                      desc, font_size=13, color=LIGHT_GRAY)
 
-    _slide_number(slide, 3)
+    return slide
 
 
 # ── SLIDE 4 – DISCLOSURE QUALITY ENGINE ────────────────────────────────────
 def slide_dq_engine():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Core Engine")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Disclosure Quality Scoring", font_size=40, bold=True)
+    slide = _content_slide("Core Engine", "Disclosure Quality Scoring")
 
     # Formula card
-    _add_rect(slide, Inches(1), Inches(2.3), Inches(11.3), Inches(1.2), CARD_BG, ACCENT, Pt(1))
-    _add_text(slide, Inches(1.4), Inches(2.45), Inches(10), Inches(0.4),
+    _add_rect(slide, _IN(1), _IN(2.3), _IN(11.3), _IN(1.2), CARD_BG, ACCENT, Pt(1))
+    _add_text(slide, _IN(1.4), _IN(2.45), _IN(10), _IN(0.4),
               "DQ Score =  0.35 × Completeness  +  0.25 × Consistency  +  0.20 × Assurance  +  0.20 × Transparency",
               font_size=16, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-    _add_text(slide, Inches(1.4), Inches(2.95), Inches(10), Inches(0.35),
+    _add_text(slide, _IN(1.4), _IN(2.95), _IN(10), _IN(0.35),
               "Bands:  High ≥ 75   ·   Medium 50-74   ·   Low < 50   |   All evidence-grounded with source page references",
               font_size=12, color=MID_GRAY, alignment=PP_ALIGN.CENTER)
 
@@ -243,26 +404,20 @@ def slide_dq_engine():
          ORANGE),
     ]
 
-    for i, (name, weight, desc, color) in enumerate(dims):
-        left = Inches(1) + Inches(i * 2.9)
-        _add_rect(slide, left, Inches(4.0), Inches(2.65), Inches(3.0), CARD_BG, color, Pt(1.5))
-
-        _pill(slide, left + Inches(0.2), Inches(4.25), weight, fill=color, text_color=DARK_BG, width=Inches(0.7), font_size=13)
-        _add_text(slide, left + Inches(1.05), Inches(4.22), Inches(1.5), Inches(0.35),
-                  name, font_size=17, bold=True, color=WHITE)
-        _add_text(slide, left + Inches(0.2), Inches(4.8), Inches(2.25), Inches(2.0),
-                  desc, font_size=12, color=LIGHT_GRAY)
+    for left, (name, weight, desc, color) in zip(_steps(1, 2.9, len(dims)), dims):
+        with _card(slide, left, _IN(4.0), _IN(2.65), _IN(3.0), color, Pt(1.5)):
+            _pill(slide, left + _IN(0.2), _IN(4.25), weight, fill=color, text_color=DARK_BG, width=_IN(0.7), font_size=13)
+            _add_text(slide, left + _IN(1.05), _IN(4.22), _IN(1.5), _IN(0.35),
+                      name, font_size=17, bold=True, color=WHITE)
+            _add_text(slide, left + _IN(0.2), _IN(4.8), _IN(2.25), _IN(2.0),
+                      desc, font_size=12, color=LIGHT_GRAY)
 
-    _slide_number(slide, 4)
+    return slide
 
 
 # ── SLIDE 5 – AI & ML PIPELINE ─────────────────────────────────────────────
 def slide_ai_pipeline():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "AI & ML")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Multi-model intelligence pipeline", font_size=40, bold=True)
+    slide = _content_slide("AI & ML", "Multi-model intelligence pipeline")
 
     steps = [
         ("PDF → Markdown", "Workers AI\ntoMarkdown()", "Converts report PDFs into\nclean, structured text"),
@@ -272,41 +427,33 @@ def slide_ai_pipeline():
         ("Grounded Chat", "Mistral / Llama\nContext Window", "Q&A over report text,\nno hallucinations"),
     ]
 
+    lefts = _steps(0.6, 2.5, len(steps))
     for i, (title, model, desc) in enumerate(steps):
-        left = Inches(0.6) + Inches(i * 2.5)
-        _add_rect(slide, left, Inches(2.5), Inches(2.25), Inches(3.8), CARD_BG)
-
-        # Step number circle
-        circ = slide.shapes.add_shape(MSO_SHAPE.OVAL, left + Inches(0.8), Inches(2.75), Inches(0.5), Inches(0.5))
-        circ.fill.solid(); circ.fill.fore_color.rgb = ACCENT; circ.line.fill.background()
-        tf = circ.text_frame; p = tf.paragraphs[0]
-        p.text = str(i + 1); p.font.size = Pt(18); p.font.bold = True
-        p.font.color.rgb = DARK_BG; p.alignment = PP_ALIGN.CENTER
-
-        _add_text(slide, left + Inches(0.2), Inches(3.45), Inches(1.85), Inches(0.5),
-                  title, font_size=16, bold=True, color=WHITE)
-        _add_text(slide, left + Inches(0.2), Inches(3.95), Inches(1.85), Inches(0.6),
-                  model, font_size=12, color=ACCENT)
-        _add_text(slide, left + Inches(0.2), Inches(4.7), Inches(1.85), Inches(1.2),
-                  desc, font_size=12, color=LIGHT_GRAY)
+        left = lefts[i]
+        with _card(slide, left, _IN(2.5), _IN(2.25), _IN(3.8)):
+            # Step number circle
+            _dot(slide, left + _IN(0.8), _IN(2.75), _IN(0.5), ACCENT, str(i + 1))
+
+            _add_text(slide, left + _IN(0.2), _IN(3.45), _IN(1.85), _IN(0.5),
+                      title, font_size=16, bold=True, color=WHITE)
+            _add_text(slide, left + _IN(0.2), _IN(3.95), _IN(1.85), _IN(0.6),
+                      model, font_size=12, color=ACCENT)
+            _add_text(slide, left + _IN(0.2), _IN(4.7), _IN(1.85), _IN(1.2),
+                      desc, font_size=12, color=LIGHT_GRAY)
 
         # Arrow between steps
         if i < len(steps) - 1:
-            _add_text(slide, left + Inches(2.25), Inches(3.7), Inches(0.3), Inches(0.5),
+            _add_text(slide, left + _IN(2.25), _IN(3.7), _IN(0.3), _IN(0.5),
                       "→", font_size=24, color=ACCENT, bold=True, alignment=PP_ALIGN.CENTER)
 
-    _slide_number(slide, 5)
+    return slide
 
 
 # ── SLIDE 6 – COVERAGE UNIVERSE ────────────────────────────────────────────
 def slide_coverage():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Coverage")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "953 European sustainability reports", font_size=40, bold=True)
+    slide = _content_slide("Coverage", "953 European sustainability reports")
 
-    _add_text(slide, Inches(1), Inches(2.1), Inches(10), Inches(0.5),
+    _add_text(slide, _IN(1), _IN(2.1), _IN(10), _IN(0.5),
               "CSRD-aligned disclosures from 2024 annual & sustainability reports, covering 32 countries and 11 GICS sectors.",
               font_size=16, color=LIGHT_GRAY)
 
@@ -317,49 +464,43 @@ def slide_coverage():
         ("11", "GICS Sectors"),
         ("50+", "DQ Features"),
     ]
-    for i, (num, label) in enumerate(stats):
-        left = Inches(1) + Inches(i * 3)
-        _add_rect(slide, left, Inches(3.0), Inches(2.65), Inches(1.6), CARD_BG, ACCENT, Pt(1))
-        _add_text(slide, left, Inches(3.15), Inches(2.65), Inches(0.7),
-                  num, font_size=42, bold=True, color=ACCENT, alignment=PP_ALIGN.CENTER)
-        _add_text(slide, left, Inches(3.85), Inches(2.65), Inches(0.4),
-                  label, font_size=15, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+    for left, (num, label) in zip(_steps(1, 3, len(stats)), stats):
+        with _card(slide, left, _IN(3.0), _IN(2.65), _IN(1.6), ACCENT, Pt(1)):
+            _add_text(slide, left, _IN(3.15), _IN(2.65), _IN(0.7),
+                      num, font_size=42, bold=True, color=ACCENT, alignment=PP_ALIGN.CENTER)
+            _add_text(slide, left, _IN(3.85), _IN(2.65), _IN(0.4),
+                      label, font_size=15, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
 
     # Top sectors table
-    _add_text(slide, Inches(1), Inches(5.0), Inches(5), Inches(0.4),
+    _add_text(slide, _IN(1), _IN(5.0), _IN(5), _IN(0.4),
               "Top Sectors by Coverage", font_size=18, bold=True)
 
     sectors = [
         ("Industrials", "233"), ("Financials", "162"), ("Consumer Discretionary", "88"),
         ("Information Technology", "85"), ("Materials", "81"), ("Consumer Staples", "73"),
     ]
-    for i, (sector, count) in enumerate(sectors):
-        y = Inches(5.5) + Inches(i * 0.3)
-        _add_text(slide, Inches(1.2), y, Inches(3), Inches(0.3),
+    for y, (sector, count) in zip(_steps(5.5, 0.3, len(sectors)), sectors):
+        _add_text(slide, _IN(1.2), y, _IN(3), _IN(0.3),
                   f"  {sector}", font_size=12, color=LIGHT_GRAY)
-        _add_text(slide, Inches(4), y, Inches(0.8), Inches(0.3),
+        _add_text(slide, _IN(4), y, _IN(0.8), _IN(0.3),
                   count, font_size=12, color=ACCENT, bold=True, alignment=PP_ALIGN.RIGHT)
 
     # Countries
-    _add_text(slide, Inches(6.5), Inches(5.0), Inches(6), Inches(0.4),
+    _add_text(slide, _IN(6.5), _IN(5.0), _IN(6), _IN(0.4),
               "Pan-European Coverage", font_size=18, bold=True)
-    _add_text(slide, Inches(6.5), Inches(5.5), Inches(6), Inches(2.0),
+    _add_text(slide, _IN(6.5), _IN(5.5), _IN(6), _IN(2.0),
               "Germany · France · Netherlands · Italy · Spain · Belgium · Sweden\n"
               "Norway · Finland · Denmark · Austria · UK · Switzerland · Ireland\n"
               "Luxembourg · Poland · Portugal · Greece · Czech Republic · Romania\n"
               "and 12 more EU/EEA countries",
               font_size=13, color=LIGHT_GRAY)
 
-    _slide_number(slide, 6)
+    return slide
 
 
 # ── SLIDE 7 – PLATFORM FEATURES ────────────────────────────────────────────
 def slide_features():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Platform")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Full-stack ESG intelligence platform", font_size=40, bold=True)
+    slide = _content_slide("Platform", "Full-stack ESG intelligence platform")
 
     features = [
         ("🔎", "Report Library", "Browse, filter, and search 953 sustainability reports by company, sector, country, or year.", "LIVE", ACCENT),
@@ -370,32 +511,26 @@ def slide_features():
         ("📈", "Company Profiles", "Deep-dive ESG profiles with score breakdowns, risk factors, peer comparison, and time-series.", "PLANNED", MID_GRAY),
     ]
 
+    cols, rows = _steps(1, 3.9, 3), _steps(2.3, 2.5, 2)
     for i, (icon, title, desc, status, status_color) in enumerate(features):
-        col = i % 3
-        row = i // 3
-        left = Inches(1) + Inches(col * 3.9)
-        top  = Inches(2.3) + Inches(row * 2.5)
-        _add_rect(slide, left, top, Inches(3.6), Inches(2.2), CARD_BG)
-
-        _add_text(slide, left + Inches(0.2), top + Inches(0.2), Inches(0.5), Inches(0.5),
-                  icon, font_size=22)
-        _pill(slide, left + Inches(2.4), top + Inches(0.25), status, fill=status_color,
-              text_color=DARK_BG if status == "LIVE" else WHITE, width=Inches(1.0), font_size=9)
-        _add_text(slide, left + Inches(0.2), top + Inches(0.7), Inches(3.2), Inches(0.4),
-                  title, font_size=17, bold=True, color=WHITE)
-        _add_text(slide, left + Inches(0.2), top + Inches(1.15), Inches(3.2), Inches(1.0),
-                  desc, font_size=12, color=LIGHT_GRAY)
+        left = cols[i % 3]
+        top  = rows[i // 3]
+        with _card(slide, left, top, _IN(3.6), _IN(2.2)):
+            _add_text(slide, left + _IN(0.2), top + _IN(0.2), _IN(0.5), _IN(0.5),
+                      icon, font_size=22)
+            _pill(slide, left + _IN(2.4), top + _IN(0.25), status, fill=status_color,
+                  text_color=DARK_BG if status == "LIVE" else WHITE, width=_IN(1.0), font_size=9)
+            _add_text(slide, left + _IN(0.2), top + _IN(0.7), _IN(3.2), _IN(0.4),
+                      title, font_size=17, bold=True, color=WHITE)
+            _add_text(slide, left + _IN(0.2), top + _IN(1.15), _IN(3.2), _IN(1.0),
+                      desc, font_size=12, color=LIGHT_GRAY)
 
-    _slide_number(slide, 7)
+    return slide
 
 
 # ── SLIDE 8 – TECH STACK ───────────────────────────────────────────────────
 def slide_tech():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Technology")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Cloud-native, edge-first architecture", font_size=40, bold=True)
+    slide = _content_slide("Technology", "Cloud-native, edge-first architecture")
 
     layers = [
         ("Frontend", [
@@ -424,27 +559,21 @@ def slide_tech():
         ], ORANGE),
     ]
 
-    for i, (title, items, color) in enumerate(layers):
-        left = Inches(1) + Inches(i * 3.05)
-        _add_rect(slide, left, Inches(2.3), Inches(2.8), Inches(4.4), CARD_BG, color, Pt(1))
-        _add_text(slide, left + Inches(0.25), Inches(2.5), Inches(2.3), Inches(0.4),
-                  title, font_size=18, bold=True, color=color)
+    for left, (title, items, color) in zip(_steps(1, 3.05, len(layers)), layers):
+        with _card(slide, left, _IN(2.3), _IN(2.8), _IN(4.4), color, Pt(1)):
+            _add_text(slide, left + _IN(0.25), _IN(2.5), _IN(2.3), _IN(0.4),
+                      title, font_size=18, bold=True, color=color)
 
-        for j, item in enumerate(items):
-            y = Inches(3.1) + Inches(j * 0.85)
-            _add_text(slide, left + Inches(0.25), y, Inches(2.3), Inches(0.75),
-                      item, font_size=12, color=LIGHT_GRAY)
+            for y, item in zip(_steps(3.1, 0.85, len(items)), items):
+                _add_text(slide, left + _IN(0.25), y, _IN(2.3), _IN(0.75),
+                          item, font_size=12, color=LIGHT_GRAY)
 
-    _slide_number(slide, 8)
+    return slide
 
 
 # ── SLIDE 9 – TRACTION ─────────────────────────────────────────────────────
 def slide_traction():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Traction")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "What we've built (solo, in months)", font_size=40, bold=True)
+    slide = _content_slide("Traction", "What we've built (solo, in months)")
 
     milestones = [
         ("953 reports", "collected, extracted, and indexed from EU-listed companies"),
@@ -455,35 +584,25 @@ def slide_traction():
         ("Live platform", "deployed end-to-end on Cloudflare edge infrastructure"),
     ]
 
+    cols, rows = _steps(1, 6, 2), _steps(2.5, 1.5, 3)
     for i, (metric, desc) in enumerate(milestones):
-        col = i % 2
-        row = i // 2
-        left = Inches(1) + Inches(col * 6)
-        top  = Inches(2.5) + Inches(row * 1.5)
-        _add_rect(slide, left, top, Inches(5.6), Inches(1.2), CARD_BG)
-
-        # Checkmark circle
-        circ = slide.shapes.add_shape(MSO_SHAPE.OVAL, left + Inches(0.3), top + Inches(0.3), Inches(0.5), Inches(0.5))
-        circ.fill.solid(); circ.fill.fore_color.rgb = ACCENT; circ.line.fill.background()
-        tf = circ.text_frame; p = tf.paragraphs[0]
-        p.text = "✓"; p.font.size = Pt(18); p.font.bold = True
-        p.font.color.rgb = DARK_BG; p.alignment = PP_ALIGN.CENTER
+        left = cols[i % 2]
+        top  = rows[i // 2]
+        with _card(slide, left, top, _IN(5.6), _IN(1.2)):
+            # Checkmark circle
+            _dot(slide, left + _IN(0.3), top + _IN(0.3), _IN(0.5), ACCENT, "✓")
 
-        _add_text(slide, left + Inches(1.0), top + Inches(0.2), Inches(4.3), Inches(0.4),
-                  metric, font_size=18, bold=True, color=WHITE)
-        _add_text(slide, left + Inches(1.0), top + Inches(0.65), Inches(4.3), Inches(0.4),
-                  desc, font_size=13, color=LIGHT_GRAY)
+            _add_text(slide, left + _IN(1.0), top + _IN(0.2), _IN(4.3), _IN(0.4),
+                      metric, font_size=18, bold=True, color=WHITE)
+            _add_text(slide, left + _IN(1.0), top + _IN(0.65), _IN(4.3), _IN(0.4),
+                      desc, font_size=13, color=LIGHT_GRAY)
 
-    _slide_number(slide, 9)
+    return slide
 
 
 # ── SLIDE 10 – ROADMAP ─────────────────────────────────────────────────────
 def slide_roadmap():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Roadmap")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "From Disclosure Quality to ESG Ratings", font_size=40, bold=True)
+    slide = _content_slide("Roadmap", "From Disclosure Quality to ESG Ratings")
 
     phases = [
         ("NOW", "Foundation", [
@@ -512,41 +631,33 @@ def slide_roadmap():
         ], ORANGE, False),
     ]
 
-    for i, (when, title, items, color, is_active) in enumerate(phases):
-        left = Inches(0.7) + Inches(i * 3.15)
+    for left, (when, title, items, color, is_active) in zip(_steps(0.7, 3.15, len(phases)), phases):
         border = color if is_active else None
         bw = Pt(2) if is_active else None
-        _add_rect(slide, left, Inches(2.3), Inches(2.9), Inches(4.6), CARD_BG, border, bw)
-
-        _pill(slide, left + Inches(0.25), Inches(2.55), when, fill=color, text_color=DARK_BG, width=Inches(1.2), font_size=11)
-        _add_text(slide, left + Inches(0.25), Inches(3.05), Inches(2.4), Inches(0.4),
-                  title, font_size=19, bold=True, color=WHITE)
+        with _card(slide, left, _IN(2.3), _IN(2.9), _IN(4.6), border, bw):
+            _pill(slide, left + _IN(0.25), _IN(2.55), when, fill=color, text_color=DARK_BG, width=_IN(1.2), font_size=11)
+            _add_text(slide, left + _IN(0.25), _IN(3.05), _IN(2.4), _IN(0.4),
+                      title, font_size=19, bold=True, color=WHITE)
 
-        for j, item in enumerate(items):
-            y = Inches(3.65) + Inches(j * 0.7)
-            # Small dot
-            dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, left + Inches(0.3), y + Inches(0.08), Inches(0.1), Inches(0.1))
-            dot.fill.solid(); dot.fill.fore_color.rgb = color; dot.line.fill.background()
-            _add_text(slide, left + Inches(0.55), y, Inches(2.2), Inches(0.55),
-                      item, font_size=12, color=LIGHT_GRAY)
+            for y, item in zip(_steps(3.65, 0.7, len(items)), items):
+                # Small dot
+                _fill_shape(slide.add_shape(MSO_SHAPE.OVAL, left + _IN(0.3), y + _IN(0.08), _IN(0.1), _IN(0.1)), color)
+                _add_text(slide, left + _IN(0.55), y, _IN(2.2), _IN(0.55),
+                          item, font_size=12, color=LIGHT_GRAY)
 
-    _slide_number(slide, 10)
+    return slide
 
 
 # ── SLIDE 11 – TEAM ────────────────────────────────────────────────────────
 def slide_team():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _solid_bg(slide, DARK_BG)
-    _section_tag(slide, Inches(1), Inches(0.6), "Team")
-    _add_text(slide, Inches(1), Inches(1.1), Inches(11), Inches(0.8),
-              "Built by a finance student, for the finance world", font_size=40, bold=True)
+    slide = _content_slide("Team", "Built by a finance student, for the finance world")
 
     # Main profile card
-    _add_rect(slide, Inches(1), Inches(2.5), Inches(5.5), Inches(4.2), CARD_BG, ACCENT, Pt(1))
+    _add_rect(slide, _IN(1), _IN(2.5), _IN(5.5), _IN(4.2), CARD_BG, ACCENT, Pt(1))
 
-    _add_text(slide, Inches(1.5), Inches(2.8), Inches(4.5), Inches(0.5),
+    _add_text(slide, _IN(1.5), _IN(2.8), _IN(4.5), _IN(0.5),
               "Nikhil Reddy Gogu", font_size=28, bold=True, color=WHITE)
-    _add_text(slide, Inches(1.5), Inches(3.35), Inches(4.5), Inches(0.35),
+    _add_text(slide, _IN(1.5), _IN(3.35), _IN(4.5), _IN(0.35),
               "Founder & Builder", font_size=16, color=ACCENT)
 
     details = [
@@ -558,88 +669,93 @@ def slide_team():
         "🏫  Class of '26 Representative at Antwerp Management School",
         "💻  Full-stack engineer: React, TypeScript, Python, ML, Cloudflare",
     ]
-    for i, detail in enumerate(details):
-        _add_text(slide, Inches(1.5), Inches(4.0) + Inches(i * 0.36), Inches(4.8), Inches(0.35),
+    for y, detail in zip(_steps(4.0, 0.36, len(details)), details):
+        _add_text(slide, _IN(1.5), y, _IN(4.8), _IN(0.35),
                   detail, font_size=12, color=LIGHT_GRAY)
 
     # Skills / highlights
-    _add_rect(slide, Inches(7), Inches(2.5), Inches(5.3), Inches(2.0), CARD_BG)
-    _add_text(slide, Inches(7.4), Inches(2.7), Inches(4.5), Inches(0.4),
+    _add_rect(slide, _IN(7), _IN(2.5), _IN(5.3), _IN(2.0), CARD_BG)
+    _add_text(slide, _IN(7.4), _IN(2.7), _IN(4.5), _IN(0.4),
               "Why this matters", font_size=18, bold=True, color=WHITE)
-    _add_text(slide, Inches(7.4), Inches(3.2), Inches(4.5), Inches(1.1),
+    _add_text(slide, _IN(7.4), _IN(3.2), _IN(4.5), _IN(1.1),
               "Finance domain expertise + engineering capability = \n"
               "a platform that understands what investors actually need\n"
               "from ESG disclosures and can build it end-to-end.",
               font_size=13, color=LIGHT_GRAY)
 
-    _add_rect(slide, Inches(7), Inches(4.8), Inches(5.3), Inches(1.9), CARD_BG)
-    _add_text(slide, Inches(7.4), Inches(5.0), Inches(4.5), Inches(0.4),
+    _add_rect(slide, _IN(7), _IN(4.8), _IN(5.3), _IN(1.9), CARD_BG)
+    _add_text(slide, _IN(7.4), _IN(5.0), _IN(4.5), _IN(0.4),
               "Links", font_size=18, bold=True, color=WHITE)
     links = [
         ("🌐  Portfolio:", "nikhil.chat"),
         ("💼  LinkedIn:", "linkedin.com/in/nikhilgogu"),
         ("📧  Email:", "nikhilreddy.gogu@student.ams.ac.be"),
     ]
-    for i, (label, val) in enumerate(links):
-        _add_text(slide, Inches(7.4), Inches(5.5) + Inches(i * 0.35), Inches(2), Inches(0.3),
+    for y, (label, val) in zip(_steps(5.5, 0.35, len(links)), links):
+        _add_text(slide, _IN(7.4), y, _IN(2), _IN(0.3),
                   label, font_size=12, color=LIGHT_GRAY)
-        _add_text(slide, Inches(9.2), Inches(5.5) + Inches(i * 0.35), Inches(3), Inches(0.3),
+        _add_text(slide, _IN(9.2), y, _IN(3), _IN(0.3),
                   val, font_size=12, color=ACCENT)
 
-    _slide_number(slide, 11)
+    return slide
 
 
 # ── SLIDE 12 – CALL TO ACTION ──────────────────────────────────────────────
 def slide_cta():
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _SlideShapes()
     _solid_bg(slide, DARK_BG)
 
     # Decorative accent line
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                  Inches(5.9), Inches(1.5), Inches(1.5), Inches(0.05))
-    line.fill.solid(); line.fill.fore_color.rgb = ACCENT; line.line.fill.background()
+    _fill_shape(slide.add_shape(MSO_SHAPE.RECTANGLE, _IN(5.9), _IN(1.5), _IN(1.5), _IN(0.05)), ACCENT)
 
-    _add_text(slide, Inches(1), Inches(2.0), Inches(11.3), Inches(1.0),
+    _add_text(slide, _IN(1), _IN(2.0), _IN(11.3), _IN(1.0),
               "Let's build transparent\nESG ratings together.",
               font_size=44, bold=True, alignment=PP_ALIGN.CENTER)
 
-    _add_text(slide, Inches(2), Inches(3.5), Inches(9.3), Inches(0.6),
+    _add_text(slide, _IN(2), _IN(3.5), _IN(9.3), _IN(0.6),
               "SustainabilitySignals is looking for early partners, advisors, and collaborators\n"
               "who believe ESG ratings should show their work.",
               font_size=17, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
 
     # Contact buttons
-    _add_rect(slide, Inches(3.3), Inches(4.6), Inches(6.7), Inches(1.8), CARD_BG, ACCENT, Pt(1))
+    _add_rect(slide, _IN(3.3), _IN(4.6), _IN(6.7), _IN(1.8), CARD_BG, ACCENT, Pt(1))
 
     contacts = [
-        ("📧  nikhilreddy.gogu@student.ams.ac.be", Inches(3.7)),
-        ("🌐  nikhil.chat", Inches(4.85)),
-        ("💼  linkedin.com/in/nikhilgogu", Inches(5.55)),
+        ("📧  nikhilreddy.gogu@student.ams.ac.be", _IN(3.7)),
+        ("🌐  nikhil.chat", _IN(4.85)),
+        ("💼  linkedin.com/in/nikhilgogu", _IN(5.55)),
     ]
     for text, y in contacts:
-        _add_text(slide, Inches(4.5), y, Inches(5), Inches(0.5),
+        _add_text(slide, _IN(4.5), y, _IN(5), _IN(0.5),
                   text, font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
 
-    _add_text(slide, Inches(1), Inches(6.8), Inches(11.3), Inches(0.4),
+    _add_text(slide, _IN(1), _IN(6.8), _IN(11.3), _IN(0.4),
               "SustainabilitySignals  ·  © 2026  ·   Antwerpen, Belgium",
               font_size=12, color=MID_GRAY, alignment=PP_ALIGN.CENTER)
 
-    _slide_number(slide, 12)
+    return slide
 
 
 # ── Build deck ──────────────────────────────────────────────────────────────
-slide_title()
-slide_problem()
-slide_solution()
-slide_dq_engine()
-slide_ai_pipeline()
-slide_coverage()
-slide_features()
-slide_tech()
-slide_traction()
-slide_roadmap()
-slide_team()
-slide_cta()
+SLIDES = [
+    slide_title,
+    slide_problem,
+    slide_solution,
+    slide_dq_engine,
+    slide_ai_pipeline,
+    slide_coverage,
+    slide_features,
+    slide_tech,
+    slide_traction,
+    slide_roadmap,
+    slide_team,
+    slide_cta,
+]
+
+for num, build in enumerate(SLIDES, start=1):
+    slide = build()
+    _slide_number(slide, num)
+    slide.commit()
 
 out = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "SustainabilitySignals_Pitchdeck.pptx")
 out = os.path.normpath(out)
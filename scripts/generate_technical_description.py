@@ -3,172 +3,303 @@
 Generate Technical Description (Part B) for Sustainability Signals.
 EU proposal formatting: Times New Roman 11pt, A4, 15mm margins, single spacing.
 Maximum 12 pages including cover page.
+
+Re-running is a no-op while the existing output was built from this same script
+(its hash is stored as the document's core identifier); pass --force to rebuild.
 """
 
+import docx
 from docx import Document
-from docx.shared import Pt, Mm, Cm, Inches, RGBColor
+from docx.shared import Pt, Mm, Cm, Emu, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.section import WD_ORIENT
-from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn, nsdecls
 from docx.oxml import parse_xml
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from xml.sax.saxutils import escape
+from copy import deepcopy
+from functools import lru_cache
+import hashlib
+import io
 import os
+import sys
+import zipfile
 
 OUTPUT = os.path.join(os.path.dirname(__file__), "..", "SustainabilitySignals_TechnicalDescription.docx")
 
+# Palette and point sizes, built once rather than per call.
+GREEN_DARK = RGBColor(0x1B, 0x5E, 0x20)   # section headings, table headers
+GREEN      = RGBColor(0x2E, 0x7D, 0x32)   # subsection headings
+TEXT_DARK  = RGBColor(0x33, 0x33, 0x33)
+TEXT_MID   = RGBColor(0x42, 0x42, 0x42)
+TEXT_MUTED = RGBColor(0x75, 0x75, 0x75)
+WHITE      = RGBColor(0xFF, 0xFF, 0xFF)   # table header text
+_COLOR_XML = {c: f'<w:color w:val="{c}"/>' for c in (GREEN_DARK, GREEN, TEXT_DARK, TEXT_MID, TEXT_MUTED, WHITE)}
+_MARGIN = Mm(15)
+_PT = {n: Pt(n) for n in (0, 2, 3, 4, 6, 8, 10, 11, 12, 13, 14, 15, 16, 17, 18, 20, 23, 28, 30, 33, 40, 53, 63)}
+
+@lru_cache(maxsize=None)
+def _shading(color_hex):
+    # Parsed once per colour; callers append a deep copy.
+    return parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
+
 def set_cell_shading(cell, color_hex):
     """Set cell background color."""
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
-
-def add_paragraph(doc, text, style=None, bold=False, font_size=11, alignment=None, space_after=Pt(4), space_before=Pt(0), font_name="Times New Roman", color=None, italic=False):
-    p = doc.add_paragraph()
-    if style:
-        p.style = style
-    run = p.add_run(text)
-    run.font.name = font_name
-    run.font.size = Pt(font_size)
-    run.font.bold = bold
-    run.font.italic = italic
-    if color:
-        run.font.color.rgb = color
-    p.paragraph_format.space_after = space_after
-    p.paragraph_format.space_before = space_before
-    if alignment:
-        p.alignment = alignment
-    # Set line spacing to single
-    p.paragraph_format.line_spacing = Pt(13)
-    return p
-
-def add_mixed_paragraph(doc, runs_data, space_after=Pt(4), space_before=Pt(0), alignment=None):
+    cell._tc.get_or_add_tcPr().append(deepcopy(_shading(color_hex)))
+
+# Paragraphs are rendered straight to WordprocessingML, matching what python-docx's
+# add_paragraph/add_run and font/paragraph_format setters would produce.
+_P_XML = (
+    '<w:p><w:pPr>{style}{page_break}<w:spacing w:after="{after}" w:before="{before}" w:line="{line}" w:lineRule="exact"/>'
+    '{ind}{jc}</w:pPr>{runs}</w:p>'
+)
+# Wrapper declaring the w: prefix for a batch of rendered paragraphs.
+_BODY_XML_HEAD = '<w:body %s>' % nsdecls("w")
+_TOGGLE_XML = {None: "", True: "<w:{}/>", False: '<w:{} w:val="0"/>'}
+
+
+@lru_cache(maxsize=None)
+def _rpr_xml(font_size, bold, italic, color, font_name):
+    # Only a handful of font/size/colour combinations occur; render each once.
+    font = escape(font_name, {'"': "&quot;"})
+    return (
+        f'<w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>'
+        + _TOGGLE_XML[bold].format("b") + _TOGGLE_XML[italic].format("i")
+        + (_COLOR_XML.get(color) or f'<w:color w:val="{color}"/>' if color else "")
+        + f'<w:sz w:val="{font_size * 2}"/>'
+    )
+
+
+def _run_xml(text, font_size, bold=None, italic=None, color=None, font_name="Times New Roman"):
+    """One <w:r>; bold/italic of None leave the property unset, False writes it explicitly off."""
+    rpr = _rpr_xml(font_size, bold, italic, color, font_name)
+    if not text:
+        return f"<w:r><w:rPr>{rpr}</w:rPr></w:r>"
+    return f"<w:r><w:rPr>{rpr}</w:rPr>{_text_xml(text)}</w:r>"
+
+
+def _text_xml(text):
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f"<w:t{space}>{escape(text)}</w:t>"
+
+
+@lru_cache(maxsize=None)
+def _style_id(document_part, name):
+    # Resolve a style name against the document's styles once, not per paragraph.
+    return document_part.styles[name].style_id
+
+
+def _paragraph_xml(doc, runs, space_after, space_before, line_spacing=_PT[13], alignment=None, style=None,
+                   left_indent=None, page_break_before=False):
+    return _P_XML.format(
+        style=f'<w:pStyle w:val="{_style_id(doc.part, style)}"/>' if style else "",
+        page_break="<w:pageBreakBefore/>" if page_break_before else "",
+        after=space_after.twips, before=space_before.twips, line=line_spacing.twips,
+        ind=f'<w:ind w:left="{left_indent.twips}"/>' if left_indent else "",
+        jc=f'<w:jc w:val="{alignment.xml_value}"/>' if alignment else "",
+        runs="".join(runs),
+    )
+
+
+def _insert_body_elements(doc, elements):
+    """Splice elements into the body, in order, just before its sectPr in a single insertion."""
+    body = doc.element.body
+    sectPr = body.sectPr
+    at = len(body) if sectPr is None else body.index(sectPr)
+    body[at:at] = elements
+
+
+def _insert_paragraphs(doc, paragraphs_xml):
+    """Parse rendered paragraphs in one go and insert them, in order, before the body's sectPr."""
+    ps = list(parse_xml(_BODY_XML_HEAD + "".join(paragraphs_xml) + "</w:body>"))
+    _insert_body_elements(doc, ps)
+    return [Paragraph(p, doc._body) for p in ps]
+
+
+def _append_paragraph(doc, runs, *args, **kwargs):
+    return _insert_paragraphs(doc, [_paragraph_xml(doc, runs, *args, **kwargs)])[0]
+
+def add_paragraph(doc, text, style=None, bold=False, font_size=11, alignment=None, space_after=_PT[4], space_before=_PT[0], font_name="Times New Roman", color=None, italic=False):
+    return _append_paragraph(
+        doc, [_run_xml(text, font_size, bold, italic, color, font_name)],
+        space_after, space_before, alignment=alignment, style=style)
+
+def _mixed_runs_xml(runs_data):
+    return [_run_xml(text, font_size, bold, italic, color) for text, bold, italic, font_size, color in runs_data]
+
+def add_mixed_paragraph(doc, runs_data, space_after=_PT[4], space_before=_PT[0], alignment=None):
     """Add paragraph with mixed formatting. runs_data is list of (text, bold, italic, font_size, color)."""
-    p = doc.add_paragraph()
-    for text, bold, italic, font_size, color in runs_data:
-        run = p.add_run(text)
-        run.font.name = "Times New Roman"
-        run.font.size = Pt(font_size)
-        run.font.bold = bold
-        run.font.italic = italic
-        if color:
-            run.font.color.rgb = color
-    p.paragraph_format.space_after = space_after
-    p.paragraph_format.space_before = space_before
-    p.paragraph_format.line_spacing = Pt(13)
-    if alignment:
-        p.alignment = alignment
-    return p
-
-def add_heading_styled(doc, text, level=1, font_size=14, color=None, space_before=Pt(12), space_after=Pt(6)):
-    """Add heading with proper formatting."""
-    h = doc.add_heading(text, level=level)
-    for run in h.runs:
-        run.font.name = "Times New Roman"
-        run.font.size = Pt(font_size)
-        if color:
-            run.font.color.rgb = color
-    h.paragraph_format.space_before = space_before
-    h.paragraph_format.space_after = space_after
-    h.paragraph_format.line_spacing = Pt(14)
-    return h
+    return _append_paragraph(doc, _mixed_runs_xml(runs_data), space_after, space_before, alignment=alignment)
+
+def add_mixed_paragraphs(doc, paragraphs_runs, space_after=_PT[4], space_before=_PT[0], alignment=None):
+    """Add several equally spaced mixed-formatting paragraphs with a single XML parse."""
+    return _insert_paragraphs(doc, [
+        _paragraph_xml(doc, _mixed_runs_xml(runs_data), space_after, space_before, alignment=alignment)
+        for runs_data in paragraphs_runs
+    ])
+
+# Heading level -> (font size, colour, space before). Every heading is Times New Roman
+# with 6pt after and an exact 14pt line; the built-in bold and keep-with-next stay.
+_HEADING_FORMATS = {1: (15, GREEN_DARK, _PT[14]), 2: (13, GREEN, _PT[12])}
+_HEADING_XML = '<w:p><w:pPr><w:pStyle w:val="{style}"/>{page_break}{spacing}</w:pPr><w:r>{text}</w:r></w:p>'
+
+
+def style_headings(doc):
+    """Apply the heading formats to the document's Heading styles, once."""
+    for level, (font_size, color, space_before) in _HEADING_FORMATS.items():
+        style = doc.styles[f"Heading {level}"]
+        style.font.name = "Times New Roman"
+        # The theme font attributes would otherwise win over the explicit typeface.
+        rFonts = style.element.rPr.rFonts
+        for attr in ("w:asciiTheme", "w:hAnsiTheme"):
+            rFonts.attrib.pop(qn(attr), None)
+        style.font.size = _PT[font_size]
+        style.font.color.rgb = color
+        style.paragraph_format.space_before = space_before
+        style.paragraph_format.space_after = _PT[6]
+        style.paragraph_format.line_spacing = _PT[14]
+
+def add_heading_styled(doc, text, level=1, space_before=None, space_after=None, page_break_before=False):
+    """Add a heading in the styled Heading N style; spacing arguments override the style's."""
+    spacing = "".join(
+        f' w:{name}="{value.twips}"' for name, value in (("after", space_after), ("before", space_before))
+        if value is not None
+    )
+    return _insert_paragraphs(doc, [_HEADING_XML.format(
+        style=_style_id(doc.part, f"Heading {level}"),
+        page_break="<w:pageBreakBefore/>" if page_break_before else "",
+        spacing=f"<w:spacing{spacing}/>" if spacing else "",
+        text=_text_xml(text),
+    )])[0]
+
+def _bullet_xml(doc, text, bold_prefix="", font_size=11, level=0):
+    runs = [_run_xml(bold_prefix, font_size, bold=True)] if bold_prefix else []
+    runs.append(_run_xml(text, font_size))
+    return _paragraph_xml(doc, runs, _PT[2], _PT[0], style="List Bullet",
+                          left_indent=Cm(1.2 * level) if level > 0 else None)
 
 def add_bullet(doc, text, bold_prefix="", font_size=11, level=0):
     """Add a bullet point."""
-    p = doc.add_paragraph()
-    p.style = "List Bullet"
-    if bold_prefix:
-        run_b = p.add_run(bold_prefix)
-        run_b.font.name = "Times New Roman"
-        run_b.font.size = Pt(font_size)
-        run_b.font.bold = True
-    run = p.add_run(text)
-    run.font.name = "Times New Roman"
-    run.font.size = Pt(font_size)
-    p.paragraph_format.space_after = Pt(2)
-    p.paragraph_format.space_before = Pt(0)
-    p.paragraph_format.line_spacing = Pt(13)
-    if level > 0:
-        p.paragraph_format.left_indent = Cm(1.2 * level)
-    return p
+    return _insert_paragraphs(doc, [_bullet_xml(doc, text, bold_prefix, font_size, level)])[0]
+
+def add_bullets(doc, items, font_size=11):
+    """Add a run of bullet points from (bold_prefix, text) pairs with a single XML parse."""
+    return _insert_paragraphs(doc, [_bullet_xml(doc, text, prefix, font_size) for prefix, text in items])
+
+# One table cell: Times New Roman 10pt, 1pt before/after, exact 12pt line, optional shading.
+# Everything before the text depends only on (width, rpr, shd) and is rendered once per combination.
+_CELL_OPEN_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{shd}</w:tcPr><w:p><w:pPr>'
+    '<w:spacing w:after="20" w:before="20" w:line="240" w:lineRule="exact"/></w:pPr><w:r><w:rPr>'
+    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman"/>{rpr}<w:sz w:val="20"/></w:rPr>'
+)
+_CELL_CLOSE_XML = '</w:r></w:p></w:tc>'
+# The whole table, centred and referencing the "Table Grid" style, whose definition
+# already carries the grid borders, so nothing border-related is written per cell.
+_TABLE_XML = (
+    '<w:tbl %s><w:tblPr><w:tblStyle w:val="{style}"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:jc w:val="center"/><w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+    'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+) % nsdecls("w")
+_HEADER_RPR = "<w:b/>" + _COLOR_XML[WHITE]
+_HEADER_SHD = '<w:shd w:fill="1B5E20"/>'
+_ALT_ROW_SHD = '<w:shd w:fill="E8F5E9"/>'
+
+
+@lru_cache(maxsize=None)
+def _cell_open_xml(width, rpr, shd):
+    return _CELL_OPEN_XML.format(width=width, shd=shd, rpr=rpr)
+
+
+def _cell_xml(text, width, rpr="", shd=""):
+    return _cell_open_xml(width, rpr, shd) + _text_xml(text) + _CELL_CLOSE_XML
+
 
 def create_table(doc, headers, rows, col_widths=None):
     """Create a formatted table."""
-    table = doc.add_table(rows=1 + len(rows), cols=len(headers))
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.style = "Table Grid"
-    
-    # Header row
-    for i, header in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.text = ""
-        p = cell.paragraphs[0]
-        run = p.add_run(header)
-        run.font.name = "Times New Roman"
-        run.font.size = Pt(10)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-        p.paragraph_format.space_after = Pt(1)
-        p.paragraph_format.space_before = Pt(1)
-        p.paragraph_format.line_spacing = Pt(12)
-        set_cell_shading(cell, "1B5E20")
-    
-    # Data rows
-    for r_idx, row in enumerate(rows):
-        for c_idx, val in enumerate(row):
-            cell = table.rows[r_idx + 1].cells[c_idx]
-            cell.text = ""
-            p = cell.paragraphs[0]
-            run = p.add_run(str(val))
-            run.font.name = "Times New Roman"
-            run.font.size = Pt(10)
-            p.paragraph_format.space_after = Pt(1)
-            p.paragraph_format.space_before = Pt(1)
-            p.paragraph_format.line_spacing = Pt(12)
-            if r_idx % 2 == 1:
-                set_cell_shading(cell, "E8F5E9")
-    
-    if col_widths:
-        for i, w in enumerate(col_widths):
-            for row in table.rows:
-                row.cells[i].width = w
-    
-    return table
-
-
-def build_document():
+    # Columns share the text width evenly, as add_table would lay them out.
+    ncols = len(headers)
+    grid_width = Emu(doc._block_width // ncols).twips
+    widths = [w.twips for w in col_widths] if col_widths else [grid_width] * ncols
+
+    # Each cell is rendered whole (width, shading, paragraph and run formatting): header
+    # row white bold on dark green, data rows striped light green on every other row.
+    rows_xml = []
+    for r_idx, values in enumerate([headers, *rows]):
+        if r_idx == 0:
+            rpr, shd = _HEADER_RPR, _HEADER_SHD
+        else:
+            rpr, shd = "", _ALT_ROW_SHD if r_idx % 2 == 0 else ""
+        rows_xml.append("<w:tr>" + "".join(
+            _cell_xml(str(val), widths[c_idx], rpr, shd) for c_idx, val in enumerate(values)
+        ) + "</w:tr>")
+
+    tbl = parse_xml(_TABLE_XML.format(
+        style=_style_id(doc.part, "Table Grid"),
+        grid=f'<w:gridCol w:w="{grid_width}"/>' * ncols,
+        rows="".join(rows_xml),
+    ))
+    _insert_body_elements(doc, [tbl])
+    return Table(tbl, doc._body)
+
+def _source_fingerprint():
+    """The document is a pure function of this script and python-docx; hash both."""
+    h = hashlib.sha256()
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    h.update(docx.__version__.encode())
+    return h.hexdigest()
+
+def _is_up_to_date(out_path, fingerprint):
+    """True if out_path was generated from the same fingerprint (stored as its core identifier)."""
+    try:
+        with zipfile.ZipFile(out_path) as z:
+            core = z.read("docProps/core.xml")
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return False
+    return f"<dc:identifier>{fingerprint}</dc:identifier>".encode() in core
+
+
+def build_document(force=False):
+    out_path = os.path.abspath(OUTPUT)
+    fingerprint = _source_fingerprint()
+    if not force and _is_up_to_date(out_path, fingerprint):
+        print(f"Technical Description up to date: {out_path}")
+        return out_path
+
     doc = Document()
+    doc.core_properties.identifier = fingerprint
     
     # --- Page Setup: A4, 15mm margins ---
     section = doc.sections[0]
     section.page_width = Mm(210)
     section.page_height = Mm(297)
-    section.top_margin = Mm(15)
-    section.bottom_margin = Mm(15)
-    section.left_margin = Mm(15)
-    section.right_margin = Mm(15)
+    section.top_margin = section.bottom_margin = _MARGIN
+    section.left_margin = section.right_margin = _MARGIN
     
     # Set default font
     style = doc.styles["Normal"]
     font = style.font
     font.name = "Times New Roman"
-    font.size = Pt(11)
-    style.paragraph_format.line_spacing = Pt(13)
+    font.size = _PT[11]
+    style.paragraph_format.line_spacing = _PT[13]
+    style_headings(doc)
     
     # =========================================================================
     # COVER PAGE (Page 1)
     # =========================================================================
-    add_paragraph(doc, "", font_size=11, space_after=Pt(40))
+    # Vertical gaps are carried by the neighbouring paragraphs' spacing rather than
+    # empty spacer paragraphs; each gap keeps the spacer's 13pt line plus its space_after.
     add_paragraph(doc, "Technical Description (Part B)", bold=True, font_size=20,
-                  alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(20),
-                  color=RGBColor(0x1B, 0x5E, 0x20))
-    add_paragraph(doc, "", font_size=11, space_after=Pt(10))
+                  alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=_PT[20], space_before=_PT[53],
+                  color=GREEN_DARK)
     add_paragraph(doc, "SUSTAINABILITY SIGNALS", bold=True, font_size=18,
-                  alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(8),
-                  color=RGBColor(0x2E, 0x7D, 0x32))
+                  alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=_PT[8], space_before=_PT[23],
+                  color=GREEN)
     add_paragraph(doc, "An Open, AI-Powered Platform for Transparent ESG Disclosure Quality Assessment", 
-                  font_size=13, alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(30),
-                  italic=True, color=RGBColor(0x42, 0x42, 0x42))
-    
-    add_paragraph(doc, "", font_size=11, space_after=Pt(20))
+                  font_size=13, alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=_PT[63],
+                  italic=True, color=TEXT_MID)
     
     # Cover metadata
     cover_items = [
@@ -181,28 +312,22 @@ def build_document():
         ("Version:", "1.0"),
         ("Date:", "February 2026"),
     ]
-    for label, value in cover_items:
-        add_mixed_paragraph(doc, [
-            (label + " ", True, False, 11, RGBColor(0x33, 0x33, 0x33)),
-            (value, False, False, 11, None),
-        ], space_after=Pt(4), alignment=WD_ALIGN_PARAGRAPH.LEFT)
+    add_mixed_paragraphs(doc, [
+        [(label + " ", True, False, 11, TEXT_DARK), (value, False, False, 11, None)]
+        for label, value in cover_items
+    ], space_after=_PT[4], alignment=WD_ALIGN_PARAGRAPH.LEFT)
     
-    add_paragraph(doc, "", font_size=11, space_after=Pt(40))
     add_paragraph(doc, "This proposal is a self-contained document.", font_size=10,
-                  alignment=WD_ALIGN_PARAGRAPH.CENTER, italic=True,
-                  color=RGBColor(0x75, 0x75, 0x75))
-    
-    doc.add_page_break()
+                  alignment=WD_ALIGN_PARAGRAPH.CENTER, italic=True, space_before=_PT[53],
+                  color=TEXT_MUTED)
     
     # =========================================================================
     # SECTION 1: EXCELLENCE
     # =========================================================================
-    add_heading_styled(doc, "1. Excellence", level=1, font_size=15, 
-                       color=RGBColor(0x1B, 0x5E, 0x20), space_before=Pt(6))
+    add_heading_styled(doc, "1. Excellence", level=1, space_before=_PT[6], page_break_before=True)
     
     # --- 1.1 Objectives ---
-    add_heading_styled(doc, "1.1 Objectives and Ambition", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "1.1 Objectives and Ambition", level=2)
     
     add_paragraph(doc, 
         "Sustainability Signals is an open-source, AI-powered platform that brings transparency and rigour "
@@ -211,7 +336,7 @@ def build_document():
         "evidence-based tools for evaluating the quality of corporate sustainability disclosures.")
     
     add_paragraph(doc,
-        "The principal objectives are:", bold=True, space_after=Pt(2))
+        "The principal objectives are:", bold=True, space_after=_PT[2])
     
     objectives = [
         ("O1 — Automated Disclosure Quality Scoring: ", 
@@ -233,18 +358,15 @@ def build_document():
          "Build a comprehensive, searchable database of sustainability reports with in-browser PDF viewing, "
          "covering multiple GICS sectors, geographies, and reporting years."),
     ]
-    for prefix, text in objectives:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, objectives)
     
-    add_paragraph(doc, "", space_after=Pt(2))
     add_paragraph(doc,
         "These objectives directly respond to the European Commission's Sustainable Finance Strategy and the "
         "Corporate Sustainability Reporting Directive (CSRD), which mandates enhanced disclosure standards but "
-        "provides limited tooling for systematic disclosure quality assessment.", space_after=Pt(6))
+        "provides limited tooling for systematic disclosure quality assessment.", space_after=_PT[6], space_before=_PT[15])
 
     # --- 1.2 Relation to the Work Programme ---
-    add_heading_styled(doc, "1.2 Relation to the Work Programme", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "1.2 Relation to the Work Programme", level=2)
     
     add_paragraph(doc,
         "This proposal aligns with Horizon Europe Cluster 5 (Climate, Energy and Mobility) and Cluster 6 "
@@ -259,16 +381,15 @@ def build_document():
         "supporting the EU Taxonomy Regulation's transparency requirements.")
 
     # --- 1.3 Concept and Methodology ---
-    add_heading_styled(doc, "1.3 Concept and Methodology", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "1.3 Concept and Methodology", level=2)
     
     add_paragraph(doc,
         "The Sustainability Signals platform implements a multi-layered analytical pipeline that transforms "
         "raw sustainability report PDFs into structured, scored, and searchable intelligence. The architecture "
         "is designed around three core principles: transparency, reproducibility, and scalability.",
-        space_after=Pt(4))
+        space_after=_PT[4])
     
-    add_paragraph(doc, "1.3.1 Technical Architecture", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.1 Technical Architecture", bold=True, font_size=11, space_after=_PT[2])
     
     # Architecture table
     create_table(doc,
@@ -285,8 +406,7 @@ def build_document():
         col_widths=[Cm(2.5), Cm(6.5), Cm(8.5)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(4))
-    add_paragraph(doc, "1.3.2 Disclosure Quality (DQ) Scoring Engine", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.2 Disclosure Quality (DQ) Scoring Engine", bold=True, font_size=11, space_after=_PT[2], space_before=_PT[17])
     
     add_paragraph(doc,
         "The DQ engine is the core innovation of the platform. It implements a deterministic, regex-based "
@@ -314,11 +434,9 @@ def build_document():
         ("Evidence Refinement: ", "Optionally, extracted evidence quotes are cleaned using Llama 3.1 8B "
          "(temperature=0.1) to remove PDF artefacts while preserving all numerical data and facts."),
     ]
-    for prefix, text in dq_steps:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, dq_steps)
     
-    add_paragraph(doc, "", space_after=Pt(3))
-    add_paragraph(doc, "1.3.3 Feature Families", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.3 Feature Families", bold=True, font_size=11, space_after=_PT[2], space_before=_PT[16])
     
     add_paragraph(doc,
         "The engine detects features across the following families, aligned with major ESG reporting standards:")
@@ -338,8 +456,7 @@ def build_document():
         col_widths=[Cm(3.2), Cm(8.0), Cm(5.5)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(3))
-    add_paragraph(doc, "1.3.4 Subscore Formulas", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.4 Subscore Formulas", bold=True, font_size=11, space_after=_PT[2], space_before=_PT[16])
     
     create_table(doc,
         ["Subscore", "Weight", "Key Components (Maximum Points)", "Focus"],
@@ -352,8 +469,7 @@ def build_document():
         col_widths=[Cm(2.2), Cm(1.3), Cm(10.0), Cm(3.0)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(3))
-    add_paragraph(doc, "1.3.5 Entity Extraction Pipeline", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.5 Entity Extraction Pipeline", bold=True, font_size=11, space_after=_PT[2], space_before=_PT[16])
     
     add_paragraph(doc,
         "The entity extraction system (method: hybrid-finbert9-langextract-v2) implements a cost-efficient "
@@ -373,11 +489,9 @@ def build_document():
          "Extracted entities inherit E/S/G pillar classification from the FinBERT routing stage, enabling "
          "pillar-level aggregation and visualisation."),
     ]
-    for prefix, text in ee_steps:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, ee_steps)
     
-    add_paragraph(doc, "", space_after=Pt(3))
-    add_paragraph(doc, "1.3.6 Retrieval-Augmented Generation (RAG) Chat", bold=True, font_size=11, space_after=Pt(2))
+    add_paragraph(doc, "1.3.6 Retrieval-Augmented Generation (RAG) Chat", bold=True, font_size=11, space_after=_PT[2], space_before=_PT[16])
     
     add_paragraph(doc,
         "The platform provides report-grounded AI question-answering via a RAG architecture. The client "
@@ -388,8 +502,7 @@ def build_document():
         "and upserts embeddings to Vectorize using waitUntil() for non-blocking operation.")
 
     # --- 1.4 Novelty ---
-    add_heading_styled(doc, "1.4 Novelty and Originality", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "1.4 Novelty and Originality", level=2)
     
     add_paragraph(doc,
         "Sustainability Signals introduces several novel contributions beyond the current state-of-the-art:")
@@ -412,18 +525,15 @@ def build_document():
          "published as open-source code, enabling academic scrutiny, regulatory auditing, and community-driven "
          "improvement — a first for ESG disclosure quality assessment tools."),
     ]
-    for prefix, text in novelty_items:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, novelty_items)
 
     # =========================================================================
     # SECTION 2: IMPACT
     # =========================================================================
-    add_heading_styled(doc, "2. Impact", level=1, font_size=15,
-                       color=RGBColor(0x1B, 0x5E, 0x20), space_before=Pt(14))
+    add_heading_styled(doc, "2. Impact", level=1)
     
     # --- 2.1 Expected Impact ---
-    add_heading_styled(doc, "2.1 Expected Impacts", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "2.1 Expected Impacts", level=2)
     
     add_paragraph(doc,
         "The platform is expected to generate significant impact across multiple dimensions of the sustainable "
@@ -451,12 +561,10 @@ def build_document():
          "while the FinBERT routing stage reduces LLM inference costs by 40–60%, directly lowering the carbon "
          "footprint of AI-powered ESG analysis."),
     ]
-    for prefix, text in impacts:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, impacts)
 
     # --- 2.2 Dissemination ---
-    add_heading_styled(doc, "2.2 Communication, Dissemination, and Exploitation", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "2.2 Communication, Dissemination, and Exploitation", level=2)
     
     add_paragraph(doc,
         "The dissemination strategy leverages the platform's open-source nature and web-based accessibility:")
@@ -473,12 +581,10 @@ def build_document():
         ("Regulatory Engagement: ", "Direct engagement with EFRAG, national competent authorities, and the "
          "European Commission's Sustainable Finance Platform to inform disclosure quality standards."),
     ]
-    for prefix, text in dissem:
-        add_bullet(doc, text, bold_prefix=prefix, font_size=11)
+    add_bullets(doc, dissem)
 
     # --- 2.3 Sustainability ---
-    add_heading_styled(doc, "2.3 Sustainability and Long-Term Viability", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "2.3 Sustainability and Long-Term Viability", level=2)
     
     add_paragraph(doc,
         "The platform's sustainability is ensured through: (a) serverless, pay-per-use infrastructure with no "
@@ -490,12 +596,10 @@ def build_document():
     # =========================================================================
     # SECTION 3: IMPLEMENTATION
     # =========================================================================
-    add_heading_styled(doc, "3. Implementation", level=1, font_size=15,
-                       color=RGBColor(0x1B, 0x5E, 0x20), space_before=Pt(14))
+    add_heading_styled(doc, "3. Implementation", level=1)
     
     # --- 3.1 Work Plan ---
-    add_heading_styled(doc, "3.1 Work Plan and Work Packages", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "3.1 Work Plan and Work Packages", level=2)
     
     add_paragraph(doc, "The project is structured into five work packages over 36 months:")
     
@@ -511,8 +615,7 @@ def build_document():
         col_widths=[Cm(1.2), Cm(3.5), Cm(2.5), Cm(1.8), Cm(8.0)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(4))
-    add_paragraph(doc, "3.1.1 Implementation Timeline", bold=True, font_size=11, space_after=Pt(3))
+    add_paragraph(doc, "3.1.1 Implementation Timeline", bold=True, font_size=11, space_after=_PT[3], space_before=_PT[17])
     
     create_table(doc,
         ["Phase", "Period", "Activities"],
@@ -528,8 +631,7 @@ def build_document():
     )
 
     # --- 3.2 Management ---
-    add_heading_styled(doc, "3.2 Management Structure and Procedures", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "3.2 Management Structure and Procedures", level=2)
     
     add_paragraph(doc,
         "Project management follows an agile methodology with two-week sprint cycles, continuous integration "
@@ -543,8 +645,7 @@ def build_document():
         "ensuring numerical fidelity; and (d) cross-validation against manually assessed reports.")
 
     # --- 3.3 Resources ---
-    add_heading_styled(doc, "3.3 Resources and Budget Overview", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "3.3 Resources and Budget Overview", level=2)
     
     add_paragraph(doc,
         "The project leverages primarily serverless and edge-computing infrastructure, significantly reducing "
@@ -563,16 +664,13 @@ def build_document():
         col_widths=[Cm(3.5), Cm(8.5), Cm(4.5)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(6))
     
     # =========================================================================
     # SECTION 4: TECHNICAL SPECIFICATIONS (Additional)
     # =========================================================================
-    add_heading_styled(doc, "4. API and Data Specifications", level=1, font_size=15,
-                       color=RGBColor(0x1B, 0x5E, 0x20), space_before=Pt(14))
+    add_heading_styled(doc, "4. API and Data Specifications", level=1, space_before=_PT[33])
     
-    add_heading_styled(doc, "4.1 API Endpoints", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "4.1 API Endpoints", level=2)
     
     create_table(doc,
         ["Endpoint", "Method", "Function", "Auth"],
@@ -588,9 +686,7 @@ def build_document():
         col_widths=[Cm(4.5), Cm(2.0), Cm(8.0), Cm(2.5)]
     )
     
-    add_paragraph(doc, "", space_after=Pt(3))
-    add_heading_styled(doc, "4.2 Data Model and Output Contract", level=2, font_size=13,
-                       color=RGBColor(0x2E, 0x7D, 0x32))
+    add_heading_styled(doc, "4.2 Data Model and Output Contract", level=2, space_before=_PT[28])
     
     add_paragraph(doc,
         "The DQ scoring output includes: version, generatedAt, report metadata (id, key, company, year), "
@@ -608,8 +704,7 @@ def build_document():
     # =========================================================================
     # SECTION 5: ETHICAL AND SOCIETAL CONSIDERATIONS
     # =========================================================================
-    add_heading_styled(doc, "5. Ethical and Societal Considerations", level=1, font_size=15,
-                       color=RGBColor(0x1B, 0x5E, 0x20), space_before=Pt(14))
+    add_heading_styled(doc, "5. Ethical and Societal Considerations", level=1)
     
     add_paragraph(doc,
         "The platform operates under the following ethical principles: (a) Transparency — all scoring algorithms "
@@ -627,11 +722,15 @@ def build_document():
     # =========================================================================
     # SAVE
     # =========================================================================
-    out_path = os.path.abspath(OUTPUT)
-    doc.save(out_path)
+    # Assemble the zip in memory and hand it to the OS in a single write instead of
+    # one small buffered write per part.
+    buf = io.BytesIO()
+    doc.save(buf)
+    with open(out_path, "wb") as f:
+        f.write(buf.getbuffer())
     print(f"Technical Description saved to: {out_path}")
     return out_path
 
 
 if __name__ == "__main__":
-    build_document()
+    build_document(force="--force" in sys.argv[1:])
@@ -9,9 +9,10 @@ Example:
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+from reports_index import load_rows, write_rows
+
 
 def main() -> int:
     ap = argparse.ArgumentParser()
@@ -22,7 +23,7 @@ def main() -> int:
     args = ap.parse_args()
 
     index_path = Path(args.index)
-    rows = json.loads(index_path.read_text(encoding="utf-8"))
+    rows = load_rows(index_path)
     if not isinstance(rows, list):
         raise SystemExit(f"Index must be a list: {index_path}")
 
@@ -38,7 +39,11 @@ def main() -> int:
         print(f"[dry-run] Would change {changed} rows in {index_path}")  # noqa: T201
         return 0
 
-    index_path.write_text(json.dumps(rows, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if not changed:
+        print(f"Unchanged: {index_path}")  # noqa: T201
+        return 0
+
+    write_rows(index_path, rows)
     print(f"Updated: {index_path} (changed {changed} rows)")  # noqa: T201
     return 0
 
@@ -7,8 +7,10 @@ contact info already on Team slide 11), then convert to PDF.
 
 from pptx import Presentation
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
 import copy
 import os
+import shutil
 import subprocess
 import sys
 
@@ -17,67 +19,72 @@ DST_PPTX = os.path.join(os.path.dirname(__file__), "..", "SustainabilitySignals_
 DST_PDF = os.path.join(os.path.dirname(__file__), "..", "SustainabilitySignals_10slides.pdf")
 
 
-def delete_slide(prs, slide_index):
-    """Delete a slide by index (0-based) from the presentation."""
-    rId = None
-    slide = prs.slides[slide_index]
-    # Find the relationship ID for this slide
-    for rel in prs.part.rels.values():
-        if rel.target_part == slide.part:
-            rId = rel.rId
-            break
-    if rId is None:
-        raise ValueError(f"Could not find relationship for slide {slide_index}")
+def delete_slides(prs, slide_indices):
+    """Delete slides by index (0-based) from the presentation in one pass."""
+    # Map each slide part to its relationship ID once rather than searching per slide
+    rId_by_part = {rel.target_part: rel.rId for rel in prs.part.rels.values() if rel.reltype == RT.SLIDE}
+    slides = prs.slides
+    rIds = set()
+    for slide_index in slide_indices:
+        rId = rId_by_part.get(slides[slide_index].part)
+        if rId is None:
+            raise ValueError(f"Could not find relationship for slide {slide_index}")
+        rIds.add(rId)
     
     # Remove from slide list XML
-    from lxml import etree
-    nsmap = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
-             'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'}
-    sldIdLst = prs.part._element.find('{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst')
+    sldIdLst = prs.part._element.find(qn('p:sldIdLst'))
     for sldId in list(sldIdLst):
-        if sldId.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id') == rId:
+        if sldId.get(qn('r:id')) in rIds:
             sldIdLst.remove(sldId)
-            break
     
-    # Remove the relationship
-    prs.part.rels.pop(rId)
+    # Remove the relationships
+    for rId in rIds:
+        prs.part.rels.pop(rId)
+
+
+# Text bodies of a slide's top-level shapes, and the text of one a:p (runs and fields),
+# queried directly rather than by walking the shape/paragraph/run proxies
+TXBODY_XPATH = "./p:cSld/p:spTree/p:sp/p:txBody"
+PARAGRAPH_TEXT_XPATH = "./a:r/a:t/text() | ./a:fld/a:t/text()"
+
+
+def paragraph_text(paragraph):
+    return "".join(paragraph.xpath(PARAGRAPH_TEXT_XPATH)).strip()
+
+
+def slide_title(slide, skip_numbers=False):
+    """First non-empty paragraph on the slide (optionally skipping page numbers), max 60 chars."""
+    for paragraph in slide.element.xpath(TXBODY_XPATH + "/a:p"):
+        text = paragraph_text(paragraph)
+        if text and not (skip_numbers and text.isdigit()):
+            return text[:60]
+    return ""
 
 
 def update_slide_numbers(prs):
     """Update page number text boxes on each slide."""
     for i, slide in enumerate(prs.slides, 1):
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for paragraph in shape.text_frame.paragraphs:
-                    text = paragraph.text.strip()
-                    # Find standalone number text boxes (page numbers)
-                    if text.isdigit() and int(text) <= 12:
-                        for run in paragraph.runs:
-                            run.text = str(i)
-                        break
+        for txBody in slide.element.xpath(TXBODY_XPATH):
+            for paragraph in txBody.xpath("./a:p"):
+                text = paragraph_text(paragraph)
+                # Find standalone number text boxes (page numbers)
+                if text.isdigit() and int(text) <= 12:
+                    for t in paragraph.xpath("./a:r/a:t"):
+                        t.text = str(i)
+                    break
 
 
 def main():
     prs = Presentation(os.path.abspath(SRC))
     print(f"Original slide count: {len(prs.slides)}")
     
-    # Delete slide 12 first (0-indexed: 11), then slide 8 (0-indexed: 7)
-    # Must delete from the end to preserve indices
+    # Indices refer to the original deck; all slides are removed together
     slides_to_remove = [11, 7]  # 0-indexed: slide 12 (CTA) and slide 8 (Technology)
     
+    slides = prs.slides
     for idx in sorted(slides_to_remove, reverse=True):
-        slide = prs.slides[idx]
-        title = ""
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for p in shape.text_frame.paragraphs:
-                    if p.text.strip():
-                        title = p.text.strip()[:60]
-                        break
-            if title:
-                break
-        print(f"  Removing slide {idx + 1}: {title}")
-        delete_slide(prs, idx)
+        print(f"  Removing slide {idx + 1}: {slide_title(slides[idx])}")
+    delete_slides(prs, slides_to_remove)
     
     print(f"New slide count: {len(prs.slides)}")
     
@@ -86,16 +93,7 @@ def main():
     
     # Print final slide list
     for i, slide in enumerate(prs.slides, 1):
-        title = ""
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                for p in shape.text_frame.paragraphs:
-                    if p.text.strip() and not p.text.strip().isdigit():
-                        title = p.text.strip()[:60]
-                        break
-            if title:
-                break
-        print(f"  Slide {i}: {title}")
+        print(f"  Slide {i}: {slide_title(slide, skip_numbers=True)}")
     
     out_pptx = os.path.abspath(DST_PPTX)
     prs.save(out_pptx)
@@ -106,8 +104,51 @@ def main():
     convert_to_pdf(out_pptx, out_pdf)
 
 
+# Checked after PATH, for default Windows installs that are not on PATH
+SOFFICE_PATHS = [
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\Programs\LibreOffice\program\soffice.exe"),
+]
+
+NO_CONVERTER_HELP = """WARN: Neither PowerPoint nor LibreOffice found for PPTX->PDF.
+The 10-slide PPTX has been saved. To get PDF, either:
+  1) Install LibreOffice and re-run
+  2) Open the PPTX and File > Save As > PDF"""
+
+
+def find_soffice():
+    for name in ("soffice", "libreoffice"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return next((p for p in SOFFICE_PATHS if os.path.isfile(p)), None)
+
+
 def convert_to_pdf(pptx_path, pdf_path):
+    """Convert PPTX to PDF with headless LibreOffice, falling back to PowerPoint COM on Windows."""
+    print("Converting PPTX to PDF...")
+    soffice = find_soffice()
+    if soffice:
+        # LibreOffice names the PDF after the PPTX, which matches pdf_path
+        result = subprocess.run(
+            [soffice, "--headless", "--convert-to", "pdf", "--outdir", os.path.dirname(pdf_path), pptx_path],
+            capture_output=True, text=True, timeout=120
+        )
+        if result.returncode == 0:
+            print(f"PDF saved via LibreOffice: {pdf_path}")
+            return
+        print(f"LibreOffice failed: {(result.stderr or result.stdout).strip()}")
+    
+    if sys.platform != "win32":
+        print(NO_CONVERTER_HELP)
+        return
+    convert_to_pdf_powerpoint(pptx_path, pdf_path)
+
+
+def convert_to_pdf_powerpoint(pptx_path, pdf_path):
     """Convert PPTX to PDF using PowerShell COM automation."""
+    help_lines = "\n".join(f'    Write-Host "{line}"' for line in NO_CONVERTER_HELP.splitlines())
     ps_script = f'''
 $pptx = "{pptx_path.replace(os.sep, '/')}"
 $pdf  = "{pdf_path.replace(os.sep, '/')}"
@@ -123,31 +164,9 @@ try {{
     Write-Host "PDF saved via PowerPoint: $pdf"
 }} catch {{
     Write-Host "PowerPoint COM failed: $_"
-    Write-Host "Trying LibreOffice..."
-    
-    $libreoffice = $null
-    $paths = @(
-        "C:\\Program Files\\LibreOffice\\program\\soffice.exe",
-        "C:\\Program Files (x86)\\LibreOffice\\program\\soffice.exe",
-        "$env:LOCALAPPDATA\\Programs\\LibreOffice\\program\\soffice.exe"
-    )
-    foreach ($p in $paths) {{
-        if (Test-Path $p) {{ $libreoffice = $p; break }}
-    }}
-    
-    if ($libreoffice) {{
-        $outDir = Split-Path $pdf -Parent
-        & $libreoffice --headless --convert-to pdf --outdir $outDir $pptx
-        Write-Host "PDF saved via LibreOffice: $pdf"
-    }} else {{
-        Write-Host "WARN: Neither PowerPoint nor LibreOffice found for PPTX->PDF."
-        Write-Host "The 10-slide PPTX has been saved. To get PDF, either:"
-        Write-Host "  1) Install LibreOffice and re-run"
-        Write-Host "  2) Open the PPTX and File > Save As > PDF"
-    }}
+{help_lines}
 }}
 '''
-    print("Converting PPTX to PDF...")
     result = subprocess.run(
         ["powershell", "-NoProfile", "-Command", ps_script],
         capture_output=True, text=True, timeout=120
@@ -0,0 +1,43 @@
+"""Read and write src/data/reportsIndex.json for the index maintenance scripts."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json fallback
+    orjson = None
+
+
+def _has_float(value) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_has_float(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_float(v) for v in value)
+    return False
+
+
+def load_rows(index_path: Path):
+    if orjson is not None:
+        return orjson.loads(index_path.read_bytes())
+    return json.loads(index_path.read_text(encoding="utf-8"))
+
+
+def write_rows(index_path: Path, rows) -> None:
+    """Write ``rows`` as 2-space-indented UTF-8 JSON with a trailing newline.
+
+    For strings, ints, bools and nulls (all the index holds) orjson's output is
+    byte-identical to the json call below, so the file does not depend on which
+    one is installed. Floats can be formatted differently (e.g. ``1e16`` vs
+    ``1e+16``), so anything containing one always goes through json.
+    """
+    if orjson is not None and not _has_float(rows):
+        data = orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(rows, indent=2, ensure_ascii=False, separators=(",", ": ")) + "\n").encode("utf-8")
+    # Bytes, not text mode, so Windows does not turn "\n" into "\r\n".
+    index_path.write_bytes(data)
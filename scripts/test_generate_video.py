@@ -0,0 +1,37 @@
+"""Smoke checks for generate_video's ffmpeg filtergraph (run with ``pytest scripts``)."""
+
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip("cv2")
+gv = pytest.importorskip("generate_video")
+
+STATIC = [5, 3, 4]
+FADE, FADE_OUT, BLACK = 2, 3, 2
+# Same frame count the cv2 fallback writes: holds, n-1 cross-fades, fade to black, black hold.
+TOTAL = sum(STATIC) + (len(STATIC) - 1) * FADE + FADE_OUT + BLACK
+
+
+@pytest.mark.parametrize("n", [1, 3])
+def test_filter_graph_length_and_labels(n):
+    graph, length = gv.filter_graph(n, STATIC[:n], FADE, FADE_OUT, BLACK)
+    assert length == sum(STATIC[:n]) + (n - 1) * FADE + FADE_OUT + BLACK
+    assert graph.count("xfade=") == n - 1
+    assert graph.endswith("[v]")
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not on PATH")
+def test_filter_graph_runs_in_ffmpeg():
+    w, h = 32, 18
+    graph, length = gv.filter_graph(len(STATIC), STATIC, FADE, FADE_OUT, BLACK)
+    frames = b"".join(bytes([60 * (i + 1)]) * (w * h * 3) for i in range(len(STATIC)))
+    proc = subprocess.run(
+        [shutil.which("ffmpeg"), "-hide_banner", "-loglevel", "error",
+         "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{w}x{h}", "-r", str(gv.FPS), "-i", "-",
+         "-filter_complex", graph, "-map", "[v]", "-f", "rawvideo", "-pix_fmt", "gray", "-"],
+        input=frames, capture_output=True,
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
+    assert len(proc.stdout) // (w * h) == length == TOTAL